@@ -3,12 +3,49 @@ Ghostscript configuration and detection for HYDRA21 PDF Compressor
 """
 
 import os
+import re
 import subprocess
 import platform
+import shutil
 from pathlib import Path
 from typing import Optional, List, Tuple
 import json
 
+def _gs_version_key(executable: Path) -> Tuple[int, ...]:
+    """
+    Numeric version of the gsX.Y.Z install directory holding an executable
+    
+    Args:
+        executable: Path ending in gsX.Y.Z/bin/<executable>
+        
+    Returns:
+        Version numbers as a tuple, so gs10.02.0 sorts above gs9.56.1
+    """
+    return tuple(int(part) for part in re.findall(r"\d+", executable.parent.parent.name))
+
+# Last Ghostscript location found; a failed lookup is never stored
+_resolved_gs_path: Optional[str] = None
+
+def resolve_ghostscript_path(refresh: bool = False) -> Optional[str]:
+    """
+    Locate the Ghostscript executable, remembering it once found
+    
+    Split and merge operations detect Ghostscript every time they run;
+    a found path is cached so later lookups skip the filesystem and PATH
+    probes. A miss is probed again, so Ghostscript installed after launch
+    is picked up without a restart.
+    
+    Args:
+        refresh: Discard the cached path and probe again
+    
+    Returns:
+        Path or command name of Ghostscript, or None if not found
+    """
+    global _resolved_gs_path
+    if refresh or _resolved_gs_path is None:
+        _resolved_gs_path = GhostscriptConfig._detect_ghostscript()
+    return _resolved_gs_path
+
 class GhostscriptConfig:
     """Manages Ghostscript configuration and detection"""
     
@@ -49,16 +86,30 @@ class GhostscriptConfig:
         self._gs_path = path
         self._save_config()
     
-    def auto_detect_ghostscript(self) -> Optional[str]:
-        """Automatically detect Ghostscript installation"""
+    def auto_detect_ghostscript(self, refresh: bool = False) -> Optional[str]:
+        """
+        Automatically detect Ghostscript installation
+        
+        Args:
+            refresh: Discard the cached result and probe again
+            
+        Returns:
+            Path or command name of Ghostscript, or None if not found
+        """
+        return resolve_ghostscript_path(refresh)
+    
+    @classmethod
+    def _detect_ghostscript(cls) -> Optional[str]:
+        """Probe the system for a Ghostscript installation"""
         system = platform.system().lower()
         
         if system == "windows":
-            return self._detect_windows_ghostscript()
+            return cls._detect_windows_ghostscript()
         else:
-            return self._detect_unix_ghostscript()
+            return cls._detect_unix_ghostscript()
     
-    def _detect_windows_ghostscript(self) -> Optional[str]:
+    @classmethod
+    def _detect_windows_ghostscript(cls) -> Optional[str]:
         """Detect Ghostscript on Windows systems"""
         # Check environment variable first
         gs_path = os.getenv("GS_PATH_APP")
@@ -66,7 +117,7 @@ class GhostscriptConfig:
             return gs_path
         
         # Check if gswin64c.exe is in PATH
-        if self._is_command_available("gswin64c.exe"):
+        if cls._is_command_available("gswin64c.exe"):
             return "gswin64c.exe"
         
         # Check common installation paths
@@ -97,27 +148,26 @@ class GhostscriptConfig:
                     if path.exists():
                         return str(path)
         
+        # Any other installed version, newest first
+        for pf in program_files:
+            for executable in ("gswin64c.exe", "gswin32c.exe"):
+                newest = max(Path(pf).glob(f"gs/gs*/bin/{executable}"), key=_gs_version_key, default=None)
+                if newest is not None:
+                    return str(newest)
+        
         return None
     
-    def _detect_unix_ghostscript(self) -> Optional[str]:
+    @classmethod
+    def _detect_unix_ghostscript(cls) -> Optional[str]:
         """Detect Ghostscript on Unix-like systems (Linux, macOS)"""
-        if self._is_command_available("gs"):
+        if cls._is_command_available("gs"):
             return "gs"
         return None
     
-    def _is_command_available(self, command: str) -> bool:
+    @staticmethod
+    def _is_command_available(command: str) -> bool:
         """Check if a command is available in PATH"""
-        try:
-            check_cmd = 'where' if platform.system().lower() == 'windows' else 'which'
-            subprocess.run(
-                [check_cmd, command],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=True
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return shutil.which(command) is not None
     
     def verify_ghostscript(self, gs_path: str = None) -> Tuple[bool, str]:
         """
@@ -228,8 +278,8 @@ class GhostscriptConfig:
             else:
                 return False, f"Ruta inválida: {message}"
         else:
-            # Auto-detect
-            detected_path = self.auto_detect_ghostscript()
+            # Auto-detect, ignoring any earlier result
+            detected_path = self.auto_detect_ghostscript(refresh=True)
             if detected_path:
                 is_valid, message = self.verify_ghostscript(detected_path)
                 if is_valid:
@@ -68,8 +68,18 @@ class DirectoryConfig:
     
     def ensure_directories(self):
         """Create directories if they don't exist"""
-        for directory in [self.output_dir, self.temp_dir, self.config_dir]:
+        directories = (self.output_dir, self.temp_dir, self.config_dir)
+        
+        # Startup and every operation call this; only touch the disk once
+        if directories in _ENSURED_DIRECTORIES:
+            return
+        
+        for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRECTORIES.add(directories)
+
+# Directory sets already created during this session
+_ENSURED_DIRECTORIES = set()
 
 # Theme Configuration
 THEME_CONFIG = {
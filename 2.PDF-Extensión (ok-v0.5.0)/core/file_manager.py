@@ -8,7 +8,8 @@ import platform
 import subprocess
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 @dataclass
 class FileInfo:
@@ -20,6 +21,27 @@ class FileInfo:
     extension: str
     is_valid: bool
     error_message: Optional[str] = None
+    # String form of path, computed once; cheap to hash as a lookup key
+    path_str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.path_str = str(self.path)
+
+@lru_cache(maxsize=256)
+def _format_file_size(size_bytes: int) -> str:
+    """Format file size in human-readable format, memoized per size"""
+    if size_bytes == 0:
+        return "0 B"
+    
+    size_names = ["B", "KB", "MB", "GB", "TB"]
+    i = 0
+    size = float(size_bytes)
+    
+    while size >= 1024 and i < len(size_names) - 1:
+        size /= 1024.0
+        i += 1
+    
+    return f"{size:.2f} {size_names[i]}"
 
 class FileManager:
     """Manages file operations and validation"""
@@ -30,18 +52,7 @@ class FileManager:
     
     def format_file_size(self, size_bytes: int) -> str:
         """Format file size in human-readable format"""
-        if size_bytes == 0:
-            return "0 B"
-        
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        size = float(size_bytes)
-        
-        while size >= 1024 and i < len(size_names) - 1:
-            size /= 1024.0
-            i += 1
-        
-        return f"{size:.2f} {size_names[i]}"
+        return _format_file_size(size_bytes)
     
     def validate_file(self, file_path: Path) -> FileInfo:
         """
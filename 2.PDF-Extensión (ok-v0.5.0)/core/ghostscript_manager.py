@@ -3,13 +3,19 @@ Ghostscript operations manager for HYDRA21 PDF Compressor
 Handles PDF compression, merging, and splitting using Ghostscript
 """
 
+import asyncio
+import logging
+import os
 import subprocess
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple, List, Optional, Callable
+from typing import Tuple, List, Optional, Callable, Iterable
 from dataclasses import dataclass
 from config.settings import GS_QUALITY_PRESETS
 
+logger = logging.getLogger(__name__)
+
 @dataclass
 class OperationResult:
     """Result of a Ghostscript operation"""
@@ -20,12 +26,51 @@ class OperationResult:
     final_size: Optional[int] = None
     processing_time: Optional[float] = None
 
+def _ps_string(value) -> str:
+    """Quote a value as a PostScript string literal"""
+    text = str(value).replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return f"({text})"
+
+def _permit_args(read: Iterable[str] = (), write: Iterable[str] = ()) -> List[str]:
+    """
+    Build the SAFER file permission arguments
+
+    Args:
+        read: Files or directory patterns Ghostscript may read
+        write: Files or directory patterns Ghostscript may write
+
+    Returns:
+        List of --permit-file-* arguments
+    """
+    args = [f"--permit-file-read={path}" for path in sorted(read)]
+    args.extend(f"--permit-file-write={path}" for path in sorted(write))
+    return args
+
 class GhostscriptManager:
     """Manages Ghostscript operations for PDF processing"""
     
+    # Smallest page block worth a Ghostscript process of its own
+    MIN_SPLIT_BLOCK_PAGES = 4
+    
+    # Flags shared by every one-shot Ghostscript command: no page pauses or
+    # prompts, no per-page status output, sandboxed file access
+    ONE_SHOT_FLAGS = ("-dNOPAUSE", "-dBATCH", "-dQUIET", "-dNOPROMPT", "-dSAFER")
+    
     def __init__(self, gs_path: str):
         self.gs_path = gs_path
         self.timeout = 300  # 5 minutes default timeout
+        self._created_dirs = set()
+    
+    def _ensure_dir(self, directory: Path):
+        """
+        Create an output directory once per manager
+        
+        Args:
+            directory: Directory that must exist
+        """
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
     
     def _run_ghostscript_command(
         self, 
@@ -51,10 +96,12 @@ class GhostscriptManager:
             if platform.system().lower() == 'windows':
                 creation_flags = subprocess.CREATE_NO_WINDOW
             
+            # Page progress on stdout is never used; only stderr is kept, as
+            # raw bytes decoded on the error path
             process = subprocess.run(
                 command,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=timeout,
                 creationflags=creation_flags
             )
@@ -62,7 +109,7 @@ class GhostscriptManager:
             if process.returncode == 0:
                 return True, "Operación completada exitosamente"
             else:
-                error_msg = process.stderr.strip() if process.stderr else process.stdout.strip()
+                error_msg = process.stderr.decode('utf-8', 'replace').strip()
                 return False, f"Error de Ghostscript: {error_msg}"
                 
         except subprocess.TimeoutExpired:
@@ -72,6 +119,160 @@ class GhostscriptManager:
         except Exception as e:
             return False, f"Error inesperado: {str(e)}"
     
+    async def _run_ghostscript_command_async(
+        self,
+        command: List[str],
+        timeout: Optional[int] = None
+    ) -> Tuple[bool, str]:
+        """
+        Execute Ghostscript command without blocking the event loop
+        
+        Args:
+            command: List of command arguments
+            timeout: Command timeout in seconds
+            
+        Returns:
+            Tuple of (success, message)
+        """
+        if timeout is None:
+            timeout = self.timeout
+        
+        creation_flags = 0
+        if platform.system().lower() == 'windows':
+            creation_flags = subprocess.CREATE_NO_WINDOW
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                creationflags=creation_flags
+            )
+        except FileNotFoundError:
+            return False, f"Ejecutable de Ghostscript no encontrado: {self.gs_path}"
+        except Exception as e:
+            return False, f"Error inesperado: {str(e)}"
+        
+        try:
+            _, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return False, f"La operación excedió el tiempo límite de {timeout} segundos"
+        
+        if process.returncode == 0:
+            return True, "Operación completada exitosamente"
+        error_msg = stderr.decode('utf-8', 'replace').strip()
+        return False, f"Error de Ghostscript: {error_msg}"
+    
+    async def _run_ghostscript_commands_async(
+        self,
+        commands: List[List[str]]
+    ) -> List[Tuple[bool, str]]:
+        """
+        Execute independent Ghostscript commands concurrently
+        
+        At most one process per CPU core runs at a time.
+        
+        Args:
+            commands: Commands to execute
+            
+        Returns:
+            List of (success, message) tuples in the order of commands
+        """
+        semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+        
+        async def run_bounded(command: List[str]) -> Tuple[bool, str]:
+            async with semaphore:
+                return await self._run_ghostscript_command_async(command)
+        
+        return await asyncio.gather(*(run_bounded(command) for command in commands))
+    
+    def _page_count(self, input_path: Path) -> Optional[int]:
+        """
+        Get the number of pages of a PDF using Ghostscript
+        
+        Args:
+            input_path: Path to the PDF file
+            
+        Returns:
+            Page count, or None if it could not be determined
+        """
+        creation_flags = 0
+        if platform.system().lower() == 'windows':
+            creation_flags = subprocess.CREATE_NO_WINDOW
+        
+        # The SAFER permission must match the name PostScript opens exactly
+        pdf_file = Path(os.path.abspath(input_path)).as_posix()
+        command = [
+            self.gs_path,
+            "-dNODISPLAY",
+            "-dSAFER",
+            "-dQUIET",
+            *_permit_args(read=[pdf_file]),
+            "-c",
+            f"{_ps_string(pdf_file)} (r) file runpdfbegin pdfpagecount = quit"
+        ]
+        
+        try:
+            process = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                timeout=30,
+                creationflags=creation_flags
+            )
+            return int(process.stdout.strip().splitlines()[-1])
+        except (subprocess.SubprocessError, OSError, ValueError, IndexError) as e:
+            logger.warning("No se pudo contar las páginas de %s: %s", input_path.name, e)
+            return None
+    
+    def _split_workers(self, total_pages: int) -> int:
+        """Number of Ghostscript processes worth using for a page range"""
+        return min(os.cpu_count() or 1, total_pages // self.MIN_SPLIT_BLOCK_PAGES)
+    
+    def _needs_page_count(self, start_page: int, end_page: Optional[int]) -> bool:
+        """
+        Check if a split could use several processes, which needs the page count
+        
+        Args:
+            start_page: Starting page number (1-based)
+            end_page: Ending page number, or None for the end of the document
+            
+        Returns:
+            False when the range is known to fit a single process
+        """
+        if (os.cpu_count() or 1) <= 1:
+            return False
+        if end_page is not None:
+            return self._split_workers(end_page - start_page + 1) > 1
+        return True
+    
+    def _split_page_blocks(self, first_page: int, last_page: int) -> List[Tuple[int, int]]:
+        """
+        Divide a page range into contiguous blocks, one per worker
+        
+        Args:
+            first_page: First page of the range (1-based)
+            last_page: Last page of the range (inclusive)
+            
+        Returns:
+            List of (first, last) page tuples in document order
+        """
+        total = last_page - first_page + 1
+        workers = self._split_workers(total)
+        if workers <= 1:
+            return [(first_page, last_page)]
+        
+        block_size, remainder = divmod(total, workers)
+        blocks = []
+        start = first_page
+        for k in range(workers):
+            end = start + block_size - 1 + (1 if k < remainder else 0)
+            blocks.append((start, end))
+            start = end + 1
+        return blocks
+    
     def compress_pdf(
         self,
         input_path: Path,
@@ -111,7 +312,7 @@ class GhostscriptManager:
         original_size = input_path.stat().st_size
         
         # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_path.parent)
         
         # Build Ghostscript command
         command = [
@@ -119,9 +320,7 @@ class GhostscriptManager:
             "-sDEVICE=pdfwrite",
             "-dCompatibilityLevel=1.4",
             f"-dPDFSETTINGS={quality_setting}",
-            "-dNOPAUSE",
-            "-dQUIET",
-            "-dBATCH",
+            *self.ONE_SHOT_FLAGS,
             f"-sOutputFile={str(output_path)}",
             str(input_path)
         ]
@@ -192,16 +391,14 @@ class GhostscriptManager:
         original_size = sum(path.stat().st_size for path in input_paths)
         
         # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_path.parent)
         
         # Build Ghostscript command for merging
         command = [
             self.gs_path,
             "-sDEVICE=pdfwrite",
             "-dCompatibilityLevel=1.4",
-            "-dNOPAUSE",
-            "-dQUIET",
-            "-dBATCH",
+            *self.ONE_SHOT_FLAGS,
             f"-sOutputFile={str(output_path)}"
         ]
         
@@ -239,7 +436,8 @@ class GhostscriptManager:
         output_dir: Path,
         start_page: int = 1,
         end_page: Optional[int] = None,
-        progress_callback: Optional[Callable[[str], None]] = None
+        progress_callback: Optional[Callable[[str], None]] = None,
+        page_count: Optional[int] = None
     ) -> OperationResult:
         """
         Split PDF file into pages or page ranges
@@ -250,6 +448,7 @@ class GhostscriptManager:
             start_page: Starting page number (1-based)
             end_page: Ending page number (optional, if None splits all pages)
             progress_callback: Optional progress callback
+            page_count: Page count of the input if already known
             
         Returns:
             OperationResult with operation details
@@ -271,46 +470,68 @@ class GhostscriptManager:
         original_size = input_path.stat().st_size
         
         # Ensure output directory exists
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Build output filename pattern
-        output_pattern = output_dir / f"{input_path.stem}_page_%d.pdf"
-        
-        # Build Ghostscript command for splitting
-        command = [
-            self.gs_path,
-            "-sDEVICE=pdfwrite",
-            "-dCompatibilityLevel=1.4",
-            "-dNOPAUSE",
-            "-dQUIET",
-            "-dBATCH",
-            f"-sOutputFile={str(output_pattern)}"
-        ]
-        
-        # Add page range if specified
-        if end_page is not None:
-            command.extend([f"-dFirstPage={start_page}", f"-dLastPage={end_page}"])
-        elif start_page > 1:
-            command.append(f"-dFirstPage={start_page}")
-        
-        command.append(str(input_path))
+        self._ensure_dir(output_dir)
+        
+        # Resolve the page range so it can be spread across processes.
+        # Counting costs a Ghostscript process of its own, so it is skipped
+        # when the caller knows the count or the range fits one process
+        if page_count is None and self._needs_page_count(start_page, end_page):
+            page_count = self._page_count(input_path)
+        last_page = end_page
+        if page_count is not None:
+            last_page = min(end_page, page_count) if end_page is not None else page_count
+        
+        if last_page is not None and last_page >= start_page:
+            blocks = self._split_page_blocks(start_page, last_page)
+        else:
+            blocks = []
         
         if progress_callback:
             progress_callback("Dividiendo archivo PDF...")
         
-        # Execute split
-        success, message = self._run_ghostscript_command(command)
+        if len(blocks) > 1:
+            success, message = self._split_blocks_parallel(input_path, output_dir, blocks)
+        else:
+            # Build output filename pattern
+            output_pattern = f"{output_dir}{os.sep}{input_path.stem}_page_%d.pdf"
+            
+            # Build Ghostscript command for splitting
+            command = [
+                self.gs_path,
+                "-sDEVICE=pdfwrite",
+                "-dCompatibilityLevel=1.4",
+                *self.ONE_SHOT_FLAGS,
+                f"-sOutputFile={output_pattern}"
+            ]
+            
+            # Add page range if specified
+            if end_page is not None:
+                command.extend([f"-dFirstPage={start_page}", f"-dLastPage={end_page}"])
+            elif start_page > 1:
+                command.append(f"-dFirstPage={start_page}")
+            
+            command.append(str(input_path))
+            
+            # Execute split
+            success, message = self._run_ghostscript_command(command)
         
         processing_time = time.time() - start_time
         
         if success:
-            # Count generated files and calculate total size
-            generated_files = list(output_dir.glob(f"{input_path.stem}_page_*.pdf"))
-            final_size = sum(f.stat().st_size for f in generated_files)
+            # Count generated files and calculate total size in a single
+            # directory pass; DirEntry reuses the data read while listing
+            prefix = f"{input_path.stem}_page_"
+            generated_count = 0
+            final_size = 0
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith(prefix) and entry.name.endswith(".pdf"):
+                        generated_count += 1
+                        final_size += entry.stat().st_size
             
             return OperationResult(
                 success=True,
-                message=f"PDF dividido exitosamente ({len(generated_files)} páginas)",
+                message=f"PDF dividido exitosamente ({generated_count} páginas)",
                 output_path=output_dir,
                 original_size=original_size,
                 final_size=final_size,
@@ -323,6 +544,65 @@ class GhostscriptManager:
                 processing_time=processing_time
             )
 
+    def _split_blocks_parallel(
+        self,
+        input_path: Path,
+        output_dir: Path,
+        blocks: List[Tuple[int, int]]
+    ) -> Tuple[bool, str]:
+        """
+        Split page blocks concurrently, one Ghostscript process per block
+        
+        pdfwrite only uses one core per document, so independent page
+        ranges are handed to separate processes. Each block writes its own
+        numbered files which are then renamed to the global numbering used
+        by a single-process split.
+        
+        Args:
+            input_path: Path to input PDF
+            output_dir: Directory for output files
+            blocks: List of (first, last) page tuples in document order
+            
+        Returns:
+            Tuple of (success, message)
+        """
+        first_page = blocks[0][0]
+        
+        def run_block(index: int, block: Tuple[int, int]) -> Tuple[bool, str]:
+            block_pattern = f"{output_dir}{os.sep}{input_path.stem}_block{index}_page_%d.pdf"
+            command = [
+                self.gs_path,
+                "-sDEVICE=pdfwrite",
+                "-dCompatibilityLevel=1.4",
+                *self.ONE_SHOT_FLAGS,
+                f"-dFirstPage={block[0]}",
+                f"-dLastPage={block[1]}",
+                f"-sOutputFile={block_pattern}",
+                str(input_path)
+            ]
+            return self._run_ghostscript_command(command)
+        
+        # Subprocesses do the work, so threads are enough to keep them busy
+        with ThreadPoolExecutor(max_workers=len(blocks)) as executor:
+            futures = [
+                executor.submit(run_block, index, block)
+                for index, block in enumerate(blocks)
+            ]
+            results = [future.result() for future in futures]
+        
+        # Rename block outputs to the global page numbering, in block order
+        for index, (block_first, block_last) in enumerate(blocks):
+            offset = block_first - first_page
+            for local_number in range(1, block_last - block_first + 2):
+                block_file = output_dir / f"{input_path.stem}_block{index}_page_{local_number}.pdf"
+                if block_file.exists():
+                    block_file.replace(output_dir / f"{input_path.stem}_page_{offset + local_number}.pdf")
+        
+        for success, message in results:
+            if not success:
+                return False, message
+        return True, "Operación completada exitosamente"
+
     def split_pdf_pages(
         self,
         input_path: Path,
@@ -365,47 +645,52 @@ class GhostscriptManager:
         original_size = input_path.stat().st_size
 
         # Ensure output directory exists
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_dir)
 
         extracted_files = []
+        final_size = 0
         total_pages = len(page_numbers)
+        page_outputs = [
+            (page_num, output_dir / f"{input_path.stem}_page_{page_num:03d}.pdf")
+            for page_num in page_numbers
+        ]
 
-        for i, page_num in enumerate(page_numbers):
-            if progress_callback:
-                progress_callback(f"Extrayendo página {page_num} ({i+1}/{total_pages})...")
-
-            # Build output filename for this specific page
-            output_file = output_dir / f"{input_path.stem}_page_{page_num:03d}.pdf"
+        if progress_callback:
+            progress_callback(f"Extrayendo {total_pages} páginas...")
 
-            # Build Ghostscript command for extracting single page
-            command = [
+        # Build one Ghostscript command per page and run them concurrently;
+        # each page reports its own error
+        commands = [
+            [
                 self.gs_path,
                 "-sDEVICE=pdfwrite",
                 "-dCompatibilityLevel=1.4",
-                "-dNOPAUSE",
-                "-dQUIET",
-                "-dBATCH",
+                *self.ONE_SHOT_FLAGS,
                 f"-dFirstPage={page_num}",
                 f"-dLastPage={page_num}",
                 f"-sOutputFile={str(output_file)}",
                 str(input_path)
             ]
+            for page_num, output_file in page_outputs
+        ]
+        results = asyncio.run(self._run_ghostscript_commands_async(commands))
 
-            # Execute extraction for this page
-            success, message = self._run_ghostscript_command(command)
+        for (page_num, output_file), (success, message) in zip(page_outputs, results):
+            if success:
+                # Trust the exit code; the size lookup doubles as the check
+                try:
+                    final_size += output_file.stat().st_size
+                    extracted_files.append(output_file)
+                    continue
+                except OSError as e:
+                    message = str(e)
 
-            if success and output_file.exists():
-                extracted_files.append(output_file)
-            else:
-                # If one page fails, continue with others but note the failure
-                print(f"Error extrayendo página {page_num}: {message}")
+            # If one page fails, continue with others but note the failure
+            logger.warning("Error extrayendo página %d: %s", page_num, message)
 
         processing_time = time.time() - start_time
 
         if extracted_files:
-            # Calculate total size of extracted files
-            final_size = sum(f.stat().st_size for f in extracted_files)
-
             return OperationResult(
                 success=True,
                 message=f"Páginas extraídas exitosamente ({len(extracted_files)} de {total_pages} páginas)",
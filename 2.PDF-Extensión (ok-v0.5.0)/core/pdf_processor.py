@@ -230,7 +230,8 @@ class PDFProcessor:
         start_page: int = 1,
         end_page: Optional[int] = None,
         output_folder_name: Optional[str] = None,
-        progress_callback: Optional[Callable[[str], None]] = None
+        progress_callback: Optional[Callable[[str], None]] = None,
+        page_count: Optional[int] = None
     ) -> OperationResult:
         """
         Split PDF into individual pages or page ranges
@@ -241,6 +242,7 @@ class PDFProcessor:
             end_page: Ending page number (optional)
             output_folder_name: Custom folder name for split files
             progress_callback: Progress callback function
+            page_count: Page count of the input if already known
             
         Returns:
             OperationResult with split details
@@ -262,7 +264,8 @@ class PDFProcessor:
             output_dir=output_dir,
             start_page=start_page,
             end_page=end_page,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            page_count=page_count
         )
 
     def split_pdf_pages(
@@ -119,8 +119,8 @@ def main(page: ft.Page):
         main_window = MainWindow(page)
         page.main_window = main_window  # Store reference for cleanup
         
+        # page.add already pushes the new controls in one update
         page.add(main_window)
-        page.update()
         
         print("✅ Aplicación iniciada correctamente")
         print("🎨 Interfaz profesional cargada")
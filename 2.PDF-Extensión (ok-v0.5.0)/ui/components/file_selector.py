@@ -4,10 +4,22 @@ Provides file picker dialogs and file management UI
 """
 
 import flet as ft
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Callable, Dict
+from typing import List, Optional, Callable, Dict, Tuple
 from core.file_manager import FileManager, FileInfo
 from ui.themes.modern_components import create_modern_button, create_modern_card, create_file_info_card
+from utils.helpers import run_blocking
+
+# Immutable card styling shared by every file card
+_CARD_PAD = ft.padding.all(12)
+_CARD_ANIM = ft.Animation(150, ft.AnimationCurve.EASE_OUT)
+
+# Icons bound once at import
+_ICON_PDF = ft.Icons.PICTURE_AS_PDF
+_ICON_CLOSE = ft.Icons.CLOSE
+_ICON_FOLDER_OPEN = ft.Icons.FOLDER_OPEN
+_ICON_CLEAR = ft.Icons.CLEAR
 
 class FileSelector(ft.Column):
     """File selection component with validation and preview"""
@@ -27,7 +39,25 @@ class FileSelector(ft.Column):
         self.allow_multiple = allow_multiple
         self.max_files = max_files
 
-        self.selected_files: List[FileInfo] = []
+        # Theme colors resolved once; the theme is fixed for the selector's lifetime
+        self._c_primary = theme['primary']
+        self._c_on_surface = theme['on_surface']
+        self._c_on_surface_variant = theme['on_surface_variant']
+        self._c_surface_variant = theme['surface_variant']
+        self._c_error = theme['error']
+
+        # Keyed by path string: O(1) duplicate checks and removals, insertion ordered
+        self.selected_files: Dict[str, FileInfo] = {}
+
+        # Sum of selected file sizes, kept in step with selected_files
+        self._total_size = 0
+
+        # Card controls by path string, with the FileInfo they were built from
+        self._card_cache: Dict[str, Tuple[FileInfo, ft.Container]] = {}
+
+        # Nesting depth of _batch_updates and whether an update was skipped
+        self._update_depth = 0
+        self._update_pending = False
 
         # Create file picker
         self.file_picker = ft.FilePicker(
@@ -41,11 +71,23 @@ class FileSelector(ft.Column):
             height=300
         )
 
+        # Shown in the files list while nothing is selected
+        self._empty_placeholder = ft.Container(
+            content=ft.Text(
+                "No hay archivos seleccionados",
+                size=14,
+                color=self._c_on_surface_variant,
+                text_align=ft.TextAlign.CENTER
+            ),
+            alignment=ft.alignment.center,
+            padding=ft.padding.all(20)
+        )
+
         # Selection info
         self.selection_info = ft.Text(
             "No hay archivos seleccionados",
             size=14,
-            color=self.theme['on_surface_variant']
+            color=self._c_on_surface_variant
         )
 
         # Build the component
@@ -56,14 +98,14 @@ class FileSelector(ft.Column):
             ft.Row([
                 create_modern_button(
                     text="Seleccionar Archivos PDF" if self.allow_multiple else "Seleccionar Archivo PDF",
-                    icon=ft.Icons.FOLDER_OPEN,
+                    icon=_ICON_FOLDER_OPEN,
                     on_click=self._open_file_picker,
                     style="primary",
                     theme=self.theme
                 ),
                 create_modern_button(
                     text="Limpiar Selección",
-                    icon=ft.Icons.CLEAR,
+                    icon=_ICON_CLEAR,
                     on_click=self._clear_selection,
                     style="secondary",
                     theme=self.theme
@@ -80,7 +122,7 @@ class FileSelector(ft.Column):
                         "Archivos Seleccionados",
                         size=16,
                         weight=ft.FontWeight.W_600,
-                        color=self.theme['on_surface']
+                        color=self._c_on_surface
                     ),
                     self.files_container
                 ],
@@ -89,6 +131,31 @@ class FileSelector(ft.Column):
             )
         ]
     
+    @contextmanager
+    def _batch_updates(self):
+        """Collapse every update() issued inside the block into one"""
+        self._update_depth += 1
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if self._update_depth == 0 and self._update_pending:
+                self._update_pending = False
+                super().update()
+    
+    def update(self):
+        """Push changes to the page, deferred while a batch is open"""
+        if self._update_depth:
+            self._update_pending = True
+        else:
+            super().update()
+    
+    def did_mount(self):
+        """Render state that was set before the selector was on a page"""
+        with self._batch_updates():
+            self._update_files_display()
+            self._update_selection_info()
+    
     def _open_file_picker(self, _):
         """Open file picker dialog"""
         self.file_picker.pick_files(
@@ -98,8 +165,8 @@ class FileSelector(ft.Column):
             allow_multiple=self.allow_multiple
         )
     
-    def _on_file_picker_result(self, e: ft.FilePickerResultEvent):
-        """Handle file picker result"""
+    async def _on_file_picker_result(self, e: ft.FilePickerResultEvent):
+        """Handle file picker result, validating files off the event loop"""
         if e.files:
             # Convert to Path objects
             file_paths = [Path(f.path) for f in e.files]
@@ -109,84 +176,116 @@ class FileSelector(ft.Column):
                 self._show_error(f"Demasiados archivos seleccionados. Máximo: {self.max_files}")
                 return
             
-            # Validate files
-            valid_files, invalid_files = self.file_manager.validate_files(file_paths)
+            # Validate files; stats every file, so keep it off the UI loop
+            valid_files, invalid_files = await run_blocking(
+                self.file_manager.validate_files, file_paths
+            )
             
             # Update selected files
+            had_files = bool(self.selected_files)
             if self.allow_multiple:
                 # Add to existing selection (avoid duplicates)
-                existing_paths = {f.path for f in self.selected_files}
-                new_files = [f for f in valid_files if f.path not in existing_paths]
-                self.selected_files.extend(new_files)
+                new_files = []
+                for file_info in valid_files:
+                    if file_info.path_str not in self.selected_files:
+                        self.selected_files[file_info.path_str] = file_info
+                        self._total_size += file_info.size
+                        new_files.append(file_info)
             else:
                 # Replace selection
-                self.selected_files = valid_files[:1] if valid_files else []
+                new_files = None
+                self.selected_files = {valid_files[0].path_str: valid_files[0]} if valid_files else {}
+                self._total_size = valid_files[0].size if valid_files else 0
             
             # Show warnings for invalid files
             if invalid_files:
                 invalid_names = [f.name for f in invalid_files]
                 self._show_warning(f"Archivos inválidos ignorados: {', '.join(invalid_names)}")
             
-            # Update UI
-            self._update_files_display()
-            self._update_selection_info()
-            
-            # Notify parent
-            if self.on_files_selected and self.selected_files:
-                valid_paths = [f.path for f in self.selected_files]
-                self.on_files_selected(valid_paths)
+            # Update UI with a single round trip
+            with self._batch_updates():
+                if had_files and new_files is not None:
+                    # Existing cards stay; only the new ones are built
+                    self._append_file_cards(new_files)
+                else:
+                    self._update_files_display()
+                self._update_selection_info()
+                
+                # Notify parent
+                if self.on_files_selected and self.selected_files:
+                    self.on_files_selected(self.get_selected_files())
     
     def _clear_selection(self, _):
         """Clear file selection"""
         self.selected_files.clear()
-        self._update_files_display()
-        self._update_selection_info()
-        
-        if self.on_files_selected:
-            self.on_files_selected([])
-    
-    def _remove_file(self, file_info: FileInfo):
-        """Remove specific file from selection"""
-        if file_info in self.selected_files:
-            self.selected_files.remove(file_info)
+        self._total_size = 0
+        with self._batch_updates():
             self._update_files_display()
             self._update_selection_info()
             
             if self.on_files_selected:
-                valid_paths = [f.path for f in self.selected_files]
-                self.on_files_selected(valid_paths)
+                self.on_files_selected([])
+    
+    def _remove_file(self, file_info: FileInfo):
+        """Remove specific file from selection"""
+        removed = self.selected_files.pop(file_info.path_str, None)
+        if removed is not None:
+            self._total_size -= removed.size
+            with self._batch_updates():
+                self._update_files_display()
+                self._update_selection_info()
+                
+                if self.on_files_selected:
+                    self.on_files_selected(self.get_selected_files())
+    
+    def _on_remove_clicked(self, e):
+        """Shared remove handler; each card's button stores its path in data"""
+        file_info = self.selected_files.get(e.control.data)
+        if file_info is not None:
+            self._remove_file(file_info)
     
     def _update_files_display(self):
         """Update the files display"""
+        if self.page is None:
+            # Not mounted yet; did_mount renders the current selection
+            return
+        
         self.files_container.controls.clear()
         
+        # Forget cards of files that are no longer selected
+        for path in [p for p in self._card_cache if p not in self.selected_files]:
+            del self._card_cache[path]
+        
         if not self.selected_files:
-            self.files_container.controls.append(
-                ft.Container(
-                    content=ft.Text(
-                        "No hay archivos seleccionados",
-                        size=14,
-                        color=self.theme['on_surface_variant'],
-                        text_align=ft.TextAlign.CENTER
-                    ),
-                    alignment=ft.alignment.center,
-                    padding=ft.padding.all(20)
-                )
-            )
+            self.files_container.controls.append(self._empty_placeholder)
         else:
-            for file_info in self.selected_files:
+            for file_info in self.selected_files.values():
                 file_card = self._create_file_card(file_info)
                 self.files_container.controls.append(file_card)
         
         self.update()
     
+    def _append_file_cards(self, new_files: List[FileInfo]):
+        """Add cards for newly selected files to a non-empty list"""
+        if not new_files:
+            return
+        
+        for file_info in new_files:
+            self.files_container.controls.append(self._create_file_card(file_info))
+        
+        self.update()
+    
     def _create_file_card(self, file_info: FileInfo) -> ft.Container:
-        """Create a card for displaying file information"""
-        return ft.Container(
+        """Create a card for displaying file information, reusing cached cards"""
+        cached = self._card_cache.get(file_info.path_str)
+        if cached is not None and cached[0] == file_info:
+            return cached[1]
+        
+        card = ft.Container(
             content=ft.Row([
                 ft.Icon(
-                    ft.Icons.PICTURE_AS_PDF,
-                    color=self.theme['primary'],
+                    _ICON_PDF,
+                    color=self._c_primary,
                     size=24
                 ),
                 ft.Column([
@@ -194,45 +293,50 @@ class FileSelector(ft.Column):
                         file_info.name,
                         size=14,
                         weight=ft.FontWeight.W_500,
-                        color=self.theme['on_surface'],
+                        color=self._c_on_surface,
                         overflow=ft.TextOverflow.ELLIPSIS
                     ),
                     ft.Text(
                         f"{file_info.size_formatted} • {file_info.path.parent}",
                         size=12,
-                        color=self.theme['on_surface_variant'],
+                        color=self._c_on_surface_variant,
                         overflow=ft.TextOverflow.ELLIPSIS
                     )
                 ], spacing=2, expand=True),
                 ft.IconButton(
-                    icon=ft.Icons.CLOSE,
-                    icon_color=self.theme['error'],
+                    icon=_ICON_CLOSE,
+                    icon_color=self._c_error,
                     icon_size=20,
                     tooltip="Remover archivo",
-                    on_click=lambda _, f=file_info: self._remove_file(f)
+                    data=file_info.path_str,
+                    on_click=self._on_remove_clicked
                 )
             ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-            bgcolor=self.theme['surface_variant'],
+            bgcolor=self._c_surface_variant,
             border_radius=8,
-            padding=ft.padding.all(12),
-            animate=ft.Animation(150, ft.AnimationCurve.EASE_OUT)
+            padding=_CARD_PAD,
+            animate=_CARD_ANIM
         )
+        self._card_cache[file_info.path_str] = (file_info, card)
+        return card
     
     def _update_selection_info(self):
         """Update selection information text"""
+        if self.page is None:
+            return
+        
         if not self.selected_files:
             self.selection_info.value = "No hay archivos seleccionados"
-            self.selection_info.color = self.theme['on_surface_variant']
+            self.selection_info.color = self._c_on_surface_variant
         else:
-            total_size = sum(f.size for f in self.selected_files)
-            size_formatted = self.file_manager.format_file_size(total_size)
+            size_formatted = self.file_manager.format_file_size(self._total_size)
             
             if len(self.selected_files) == 1:
                 self.selection_info.value = f"1 archivo seleccionado ({size_formatted})"
             else:
                 self.selection_info.value = f"{len(self.selected_files)} archivos seleccionados ({size_formatted})"
             
-            self.selection_info.color = self.theme['on_surface']
+            self.selection_info.color = self._c_on_surface
         
         self.update()
     
@@ -242,7 +346,7 @@ class FileSelector(ft.Column):
             self.page.show_snack_bar(
                 ft.SnackBar(
                     content=ft.Text(message),
-                    bgcolor=self.theme['error']
+                    bgcolor=self._c_error
                 )
             )
     
@@ -258,19 +362,20 @@ class FileSelector(ft.Column):
     
     def get_selected_files(self) -> List[Path]:
         """Get list of selected file paths"""
-        return [f.path for f in self.selected_files]
+        return [f.path for f in self.selected_files.values()]
     
     def set_files(self, file_paths: List[Path]):
         """Set files programmatically"""
         if file_paths:
             valid_files, invalid_files = self.file_manager.validate_files(file_paths)
-            self.selected_files = valid_files
-            self._update_files_display()
-            self._update_selection_info()
-            
-            if self.on_files_selected:
-                valid_paths = [f.path for f in self.selected_files]
-                self.on_files_selected(valid_paths)
+            self.selected_files = {f.path_str: f for f in valid_files}
+            self._total_size = sum(f.size for f in self.selected_files.values())
+            with self._batch_updates():
+                self._update_files_display()
+                self._update_selection_info()
+                
+                if self.on_files_selected:
+                    self.on_files_selected(self.get_selected_files())
     
     def clear_files(self):
         """Clear all selected files"""
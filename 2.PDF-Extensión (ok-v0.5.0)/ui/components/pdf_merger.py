@@ -6,9 +6,9 @@ Provides PDF merging functionality with drag-and-drop reordering
 import flet as ft
 from pathlib import Path
 from typing import List, Optional, Callable, Dict, Any
-import PyPDF2
 import threading
 import time
+from utils.helpers import Throttle, run_on_ui
 
 class PDFMerger(ft.Column):
     """PDF Merger component with drag-and-drop file ordering"""
@@ -24,6 +24,9 @@ class PDFMerger(ft.Column):
         self.is_processing = False
         self.output_filename = "merged_document.pdf"
         
+        # Created on the first operation and reused afterwards
+        self._processor = None
+        
         # UI Components
         self.file_picker = None
         self.files_list_container = None
@@ -210,6 +213,9 @@ class PDFMerger(ft.Column):
         """Analyze the selected PDF files"""
         self.file_info = []
         
+        # Imported on first use so PyPDF2 stays off the startup path
+        import PyPDF2
+        
         for file_path in self.selected_files:
             try:
                 with open(file_path, 'rb') as file:
@@ -412,54 +418,59 @@ class PDFMerger(ft.Column):
             daemon=True
         ).start()
     
-    def _perform_merge(self, file_paths: List[Path]):
-        """Perform the actual merge operation"""
-        try:
-            from core.pdf_processor import PDFProcessor
-            from core.ghostscript_manager import GhostscriptManager
-            from config.settings import DirectoryConfig
+    def _get_processor(self):
+        """Get the PDF processor, reusing it while the Ghostscript path is unchanged"""
+        from core.pdf_processor import PDFProcessor
+        from core.ghostscript_manager import GhostscriptManager
+        from config.settings import DirectoryConfig
+        from config.ghostscript_config import GhostscriptConfig
 
-            # Setup processor
-            dir_config = DirectoryConfig.get_default()
-            output_dir = dir_config.output_dir / "merged"
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            # Initialize Ghostscript manager with path detection
-            from config.ghostscript_config import GhostscriptConfig
-            from config.settings import DirectoryConfig
+        dir_config = DirectoryConfig.get_default()
+        gs_path = GhostscriptConfig(dir_config.config_dir).auto_detect_ghostscript()
 
-            # Get config directory
-            dir_config = DirectoryConfig.get_default()
-            config_dir = dir_config.config_dir
+        if not gs_path:
+            raise Exception("Ghostscript no encontrado. Por favor instala Ghostscript.")
 
-            # Initialize Ghostscript config
-            gs_config = GhostscriptConfig(config_dir)
-            gs_path = gs_config.auto_detect_ghostscript()
+        if self._processor is None or self._processor.gs_manager.gs_path != gs_path:
+            # Setup processor
+            output_dir = dir_config.output_dir / "merged"
+            self._processor = PDFProcessor(GhostscriptManager(gs_path), output_dir)
 
-            if not gs_path:
-                raise Exception("Ghostscript no encontrado. Por favor instala Ghostscript.")
+        return self._processor
+    
+    def _perform_merge(self, file_paths: List[Path]):
+        """Perform the actual merge operation"""
+        # Ghostscript progress is rate-limited to one page update per 50 ms,
+        # keeping the latest message of each burst; UI callbacks from this
+        # worker are marshalled onto the event loop
+        progress = Throttle(
+            lambda message: run_on_ui(self.page, self._update_progress, message),
+            trailing=True
+        )
 
-            gs_manager = GhostscriptManager(gs_path)
-            processor = PDFProcessor(gs_manager, output_dir)
+        try:
+            processor = self._get_processor()
 
             # Update progress
-            self._update_progress("Iniciando fusión de PDFs...")
+            run_on_ui(self.page, self._update_progress, "Iniciando fusión de PDFs...")
 
             # Merge PDFs
             result = processor.merge_pdfs(
                 input_paths=file_paths,
                 output_filename=self.output_filename,
-                progress_callback=self._update_progress
+                progress_callback=progress
             )
 
-            # Update UI with results
-            self._show_merge_results(result)
+            # A trailing progress message must not land on top of the results
+            progress.cancel()
+            run_on_ui(self.page, self._show_merge_results, result)
 
         except Exception as e:
-            self._show_error(f"Error durante la fusión: {str(e)}")
+            progress.cancel()
+            run_on_ui(self.page, self._show_error, f"Error durante la fusión: {str(e)}")
         finally:
             self.is_processing = False
-            self._update_merge_button()
+            run_on_ui(self.page, self._update_merge_button)
     
     def _update_progress(self, message: str):
         """Update progress message"""
@@ -479,9 +490,7 @@ class PDFMerger(ft.Column):
                     ft.Icon(ft.Icons.CHECK_CIRCLE, color="#059669", size=28),
                     ft.Text("Fusión Completada", size=18, weight=ft.FontWeight.BOLD, color="#059669")
                 ], spacing=12),
-                ft.Container(height=12),
                 ft.Text(result.message, size=14),
-                ft.Container(height=16),
                 ft.Row([
                     ft.ElevatedButton(
                         text="Abrir Archivo",
@@ -502,7 +511,7 @@ class PDFMerger(ft.Column):
                         style=ft.ButtonStyle(bgcolor="#2563eb", color="white")
                     )
                 ], spacing=12, alignment=ft.MainAxisAlignment.CENTER)
-            ])
+            ], spacing=34)
         else:
             self._show_error(result.message)
         
@@ -561,16 +570,14 @@ class PDFMerger(ft.Column):
                 ft.Icon(ft.Icons.ERROR, color="#dc2626", size=28),
                 ft.Text("Error", size=18, weight=ft.FontWeight.BOLD, color="#dc2626")
             ], spacing=12),
-            ft.Container(height=12),
             ft.Text(message, size=14, color="#dc2626"),
-            ft.Container(height=16),
             ft.ElevatedButton(
                 text="Intentar de Nuevo",
                 icon=ft.Icons.REFRESH,
                 on_click=self._reset_interface,
                 style=ft.ButtonStyle(bgcolor="#dc2626", color="white")
             )
-        ])
+        ], spacing=34)
         self.results_container.visible = True
         self.page.update()
 
@@ -6,9 +6,9 @@ Provides PDF splitting functionality with page selection interface
 import flet as ft
 from pathlib import Path
 from typing import List, Optional, Callable, Dict, Any
-import PyPDF2
 import threading
 import time
+from utils.helpers import Throttle, run_on_ui
 
 class PDFSplitter(ft.Column):
     """PDF Splitter component with page selection interface"""
@@ -24,6 +24,9 @@ class PDFSplitter(ft.Column):
         self.selected_pages: List[int] = []
         self.is_processing = False
         
+        # Created on the first operation and reused afterwards
+        self._processor = None
+        
         # UI Components
         self.file_picker = None
         self.pdf_info_container = None
@@ -205,6 +208,9 @@ class PDFSplitter(ft.Column):
         if not self.selected_pdf or not self.selected_pdf.exists():
             return
         
+        # Imported on first use so PyPDF2 stays off the startup path
+        import PyPDF2
+        
         try:
             with open(self.selected_pdf, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
@@ -400,58 +406,65 @@ class PDFSplitter(ft.Column):
             daemon=True
         ).start()
     
-    def _perform_split(self, mode: str, pages: Optional[List[int]]):
-        """Perform the actual split operation"""
-        try:
-            from core.pdf_processor import PDFProcessor
-            from core.ghostscript_manager import GhostscriptManager
-            from config.settings import DirectoryConfig
+    def _get_processor(self):
+        """Get the PDF processor, reusing it while the Ghostscript path is unchanged"""
+        from core.pdf_processor import PDFProcessor
+        from core.ghostscript_manager import GhostscriptManager
+        from config.settings import DirectoryConfig
+        from config.ghostscript_config import GhostscriptConfig
 
-            # Setup processor
-            dir_config = DirectoryConfig.get_default()
-            output_dir = dir_config.output_dir / "split"
-            output_dir.mkdir(parents=True, exist_ok=True)
+        dir_config = DirectoryConfig.get_default()
+        gs_path = GhostscriptConfig(dir_config.config_dir).auto_detect_ghostscript()
 
-            # Initialize Ghostscript manager with path detection
-            from config.ghostscript_config import GhostscriptConfig
-            from config.settings import DirectoryConfig
+        if not gs_path:
+            raise Exception("Ghostscript no encontrado. Por favor instala Ghostscript.")
 
-            # Get config directory
-            dir_config = DirectoryConfig.get_default()
-            config_dir = dir_config.config_dir
-
-            # Initialize Ghostscript config
-            gs_config = GhostscriptConfig(config_dir)
-            gs_path = gs_config.auto_detect_ghostscript()
+        if self._processor is None or self._processor.gs_manager.gs_path != gs_path:
+            # Setup processor
+            output_dir = dir_config.output_dir / "split"
+            self._processor = PDFProcessor(GhostscriptManager(gs_path), output_dir)
 
-            if not gs_path:
-                raise Exception("Ghostscript no encontrado. Por favor instala Ghostscript.")
+        return self._processor
+    
+    def _perform_split(self, mode: str, pages: Optional[List[int]]):
+        """Perform the actual split operation"""
+        # Ghostscript progress is rate-limited to one page update per 50 ms,
+        # keeping the latest message of each burst; UI callbacks from this
+        # worker are marshalled onto the event loop
+        progress = Throttle(
+            lambda message: run_on_ui(self.page, self._update_progress, message),
+            trailing=True
+        )
 
-            gs_manager = GhostscriptManager(gs_path)
-            processor = PDFProcessor(gs_manager, output_dir)
+        try:
+            processor = self._get_processor()
 
             # Update progress
-            self._update_progress("Iniciando división de PDF...")
+            run_on_ui(self.page, self._update_progress, "Iniciando división de PDF...")
 
             if mode == "all":
                 # Split all pages
+                # The count read during analysis spares Ghostscript a counting pass
                 result = processor.split_pdf(
                     input_path=self.selected_pdf,
-                    progress_callback=self._update_progress
+                    progress_callback=progress,
+                    page_count=self.pdf_info.get('num_pages')
                 )
             else:
                 # Split selected pages using the new method
                 result = processor.split_pdf_pages(
                     input_path=self.selected_pdf,
                     page_numbers=pages,
-                    progress_callback=self._update_progress
+                    progress_callback=progress
                 )
 
-            # Update UI with results
-            self._show_split_results(result)
+            # A trailing progress message must not land on top of the results
+            progress.cancel()
+            run_on_ui(self.page, self._show_split_results, result)
 
         except Exception as e:
-            self._show_error(f"Error durante la división: {str(e)}")
+            progress.cancel()
+            run_on_ui(self.page, self._show_error, f"Error durante la división: {str(e)}")
         finally:
             self.is_processing = False
     
@@ -473,9 +486,7 @@ class PDFSplitter(ft.Column):
                     ft.Icon(ft.Icons.CHECK_CIRCLE, color="#059669", size=28),
                     ft.Text("División Completada", size=18, weight=ft.FontWeight.BOLD, color="#059669")
                 ], spacing=12),
-                ft.Container(height=12),
                 ft.Text(result.message, size=14),
-                ft.Container(height=16),
                 ft.Row([
                     ft.ElevatedButton(
                         text="Abrir Carpeta",
@@ -490,7 +501,7 @@ class PDFSplitter(ft.Column):
                         style=ft.ButtonStyle(bgcolor="#2563eb", color="white")
                     )
                 ], spacing=12, alignment=ft.MainAxisAlignment.CENTER)
-            ])
+            ], spacing=34)
         else:
             self._show_error(result.message)
         
@@ -541,16 +552,14 @@ class PDFSplitter(ft.Column):
                 ft.Icon(ft.Icons.ERROR, color="#dc2626", size=28),
                 ft.Text("Error", size=18, weight=ft.FontWeight.BOLD, color="#dc2626")
             ], spacing=12),
-            ft.Container(height=12),
             ft.Text(message, size=14, color="#dc2626"),
-            ft.Container(height=16),
             ft.ElevatedButton(
                 text="Intentar de Nuevo",
                 icon=ft.Icons.REFRESH,
                 on_click=self._reset_interface,
                 style=ft.ButtonStyle(bgcolor="#dc2626", color="white")
             )
-        ])
+        ], spacing=34)
         self.results_container.visible = True
         self.page.update()
 
@@ -4,8 +4,29 @@ Organizes different PDF operations in tabs
 """
 
 import flet as ft
+from functools import lru_cache
 from typing import Dict, List, Optional, Callable, Any
 
+# Tab button geometry, shared by every tab
+TAB_PADDING = ft.padding.symmetric(horizontal=24, vertical=14)
+TAB_RADIUS = ft.border_radius.only(top_left=12, top_right=12)
+
+@lru_cache(maxsize=None)
+def _tab_border(side_color: str, bottom_width: int, bottom_color: str) -> ft.Border:
+    """Tab border with its own bottom edge, shared per color combination"""
+    side = ft.BorderSide(1, side_color)
+    return ft.border.only(
+        left=side,
+        right=side,
+        top=side,
+        bottom=ft.BorderSide(bottom_width, bottom_color)
+    )
+
+@lru_cache(maxsize=None)
+def _outline_border(color: str) -> ft.Border:
+    """One-pixel content outline, shared per color"""
+    return ft.border.all(1, color)
+
 class TabbedInterface(ft.Column):
     """Tabbed interface for organizing PDF operations"""
     
@@ -40,6 +61,13 @@ class TabbedInterface(ft.Column):
         self.tab_bar = None
         self.content_container = None
         
+        # Placeholder content for tabs without content, built on first view
+        self._placeholders: Dict[str, ft.Control] = {}
+        
+        # Content set before the interface is on the page goes out with the
+        # page's first render instead of its own update
+        self._mounted = False
+        
         self._setup_ui()
         
         super().__init__(
@@ -48,6 +76,14 @@ class TabbedInterface(ft.Column):
             expand=True
         )
     
+    def did_mount(self):
+        """Allow content changes to push page updates"""
+        self._mounted = True
+    
+    def will_unmount(self):
+        """Stop pushing page updates once off the page"""
+        self._mounted = False
+    
     def _setup_ui(self):
         """Setup UI components"""
         # Create tab bar
@@ -70,18 +106,10 @@ class TabbedInterface(ft.Column):
                             color=self._get_tab_color(i)
                         )
                     ], spacing=8, alignment=ft.MainAxisAlignment.CENTER),
-                    padding=ft.padding.symmetric(horizontal=24, vertical=14),
-                    border_radius=ft.border_radius.only(top_left=12, top_right=12),
+                    padding=TAB_PADDING,
+                    border_radius=TAB_RADIUS,
                     bgcolor=self._get_tab_bg_color(i),
-                    border=ft.border.only(
-                        left=ft.BorderSide(1, self._get_tab_border_color(i)),
-                        right=ft.BorderSide(1, self._get_tab_border_color(i)),
-                        top=ft.BorderSide(1, self._get_tab_border_color(i)),
-                        bottom=ft.BorderSide(
-                            3 if is_active else 1,
-                            self.theme.get('primary', '#2563eb') if is_active else "transparent"
-                        )
-                    ),
+                    border=self._get_tab_border(i),
                     on_click=lambda e, tab_index=i: self._switch_tab(tab_index),
                     expand=True,
                     # Add hover effect
@@ -104,7 +132,7 @@ class TabbedInterface(ft.Column):
             padding=32,
             expand=True,
             bgcolor=self.theme.get('surface', '#ffffff'),
-            border=ft.border.all(1, self.theme.get('outline', '#e2e8f0')),
+            border=_outline_border(self.theme.get('outline', '#e2e8f0')),
             border_radius=ft.border_radius.only(
                 top_right=12, bottom_left=12, bottom_right=12
             )
@@ -142,6 +170,12 @@ class TabbedInterface(ft.Column):
             return self.theme.get('outline', '#e2e8f0')
         return "transparent"
 
+    def _get_tab_border(self, tab_index: int) -> ft.Border:
+        """Get tab border; the bottom edge marks the active tab"""
+        if tab_index == self.current_tab:
+            return _tab_border(self._get_tab_border_color(tab_index), 3, self.theme.get('primary', '#2563eb'))
+        return _tab_border(self._get_tab_border_color(tab_index), 1, "transparent")
+
     def _get_tab_hover_color(self, tab_index: int) -> str:
         """Get tab hover background color"""
         if tab_index == self.current_tab:
@@ -160,9 +194,15 @@ class TabbedInterface(ft.Column):
         if tab_index == self.current_tab:
             return
 
+        previous_tab = self.current_tab
         self.current_tab = tab_index
-        self._update_tab_appearance()
-        self._update_content()
+        
+        # Only the two tabs that changed state are restyled, and one page
+        # update sends both them and the new content
+        self._style_tabs((previous_tab, tab_index))
+        self._set_current_content()
+        if self.page:
+            self.page.update()
 
     def _on_tab_hover(self, e, tab_index: int):
         """Handle tab hover effect"""
@@ -188,21 +228,24 @@ class TabbedInterface(ft.Column):
         if not self.tab_bar or not hasattr(self.tab_bar, 'controls'):
             return
 
-        for i, tab_container in enumerate(self.tab_bar.controls):
+        self._style_tabs(range(len(self.tab_bar.controls)))
+
+        if self.page:
+            self.page.update()
+    
+    def _style_tabs(self, indices):
+        """Apply active/inactive styling to the given tabs without updating"""
+        if not self.tab_bar or not hasattr(self.tab_bar, 'controls'):
+            return
+
+        for i in indices:
+            tab_container = self.tab_bar.controls[i]
             if isinstance(tab_container, ft.Container):
                 is_active = i == self.current_tab
 
                 # Update colors
                 tab_container.bgcolor = self._get_tab_bg_color(i)
-                tab_container.border = ft.border.only(
-                    left=ft.BorderSide(1, self._get_tab_border_color(i)),
-                    right=ft.BorderSide(1, self._get_tab_border_color(i)),
-                    top=ft.BorderSide(1, self._get_tab_border_color(i)),
-                    bottom=ft.BorderSide(
-                        3 if is_active else 1,
-                        self.theme.get('primary', '#2563eb') if is_active else "transparent"
-                    )
-                )
+                tab_container.border = self._get_tab_border(i)
 
                 # Update content colors
                 if hasattr(tab_container.content, 'controls'):
@@ -213,50 +256,57 @@ class TabbedInterface(ft.Column):
                         elif isinstance(control, ft.Text):
                             control.color = self._get_tab_color(i)
                             control.weight = ft.FontWeight.W_600 if is_active else ft.FontWeight.W_500
-
-        if self.page:
-            self.page.update()
     
     def _update_content(self):
         """Update the content area based on current tab"""
         try:
-            current_tab_data = self.tabs[self.current_tab]
-
-            if current_tab_data['content']:
-                self.content_container.content = current_tab_data['content']
-            else:
-                # Show placeholder content
-                self.content_container.content = ft.Column([
-                    ft.Row([
-                        ft.Icon(current_tab_data['icon'], size=48, color="#2563eb"),
-                        ft.Column([
-                            ft.Text(
-                                f"Funcionalidad de {current_tab_data['title']}",
-                                size=20,
-                                weight=ft.FontWeight.BOLD,
-                                color="#2563eb"
-                            ),
-                            ft.Text(
-                                "Esta funcionalidad se está cargando...",
-                                size=14,
-                                color=self.theme.get('on_surface_variant', '#64748b')
-                            )
-                        ], spacing=4, expand=True)
-                    ], spacing=16, alignment=ft.MainAxisAlignment.CENTER),
-
-                    ft.Container(height=32),
-
-                    ft.Container(
-                        content=ft.ProgressRing(width=32, height=32, color="#2563eb"),
-                        alignment=ft.alignment.center
-                    )
-                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=16)
+            self._set_current_content()
 
-            if self.page:
+            if self.page and self._mounted:
                 self.page.update()
         except Exception as e:
             print(f"Error updating tab content: {e}")
     
+    def _set_current_content(self):
+        """Show the current tab's content, or its placeholder, without updating"""
+        current_tab_data = self.tabs[self.current_tab]
+
+        if current_tab_data['content']:
+            self.content_container.content = current_tab_data['content']
+        else:
+            placeholder = self._placeholders.get(current_tab_data['id'])
+            if placeholder is None:
+                placeholder = self._placeholders[current_tab_data['id']] = self._create_placeholder(current_tab_data)
+            self.content_container.content = placeholder
+    
+    def _create_placeholder(self, tab_data: Dict[str, Any]) -> ft.Control:
+        """Create the loading placeholder shown for a tab without content"""
+        return ft.Column([
+            ft.Row([
+                ft.Icon(tab_data['icon'], size=48, color="#2563eb"),
+                ft.Column([
+                    ft.Text(
+                        f"Funcionalidad de {tab_data['title']}",
+                        size=20,
+                        weight=ft.FontWeight.BOLD,
+                        color="#2563eb"
+                    ),
+                    ft.Text(
+                        "Esta funcionalidad se está cargando...",
+                        size=14,
+                        color=self.theme.get('on_surface_variant', '#64748b')
+                    )
+                ], spacing=4, expand=True)
+            ], spacing=16, alignment=ft.MainAxisAlignment.CENTER),
+
+            ft.Container(height=32),
+
+            ft.Container(
+                content=ft.ProgressRing(width=32, height=32, color="#2563eb"),
+                alignment=ft.alignment.center
+            )
+        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=16)
+    
     def set_tab_content(self, tab_id: str, content: ft.Control):
         """Set content for a specific tab"""
         for tab in self.tabs:
@@ -324,7 +374,7 @@ class TabbedInterface(ft.Column):
         
         # Update content container
         self.content_container.bgcolor = self.theme.get('surface', '#ffffff')
-        self.content_container.border = ft.border.all(1, self.theme.get('outline', '#e2e8f0'))
+        self.content_container.border = _outline_border(self.theme.get('outline', '#e2e8f0'))
         
         self.page.update()
     
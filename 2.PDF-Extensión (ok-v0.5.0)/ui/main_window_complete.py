@@ -3,14 +3,24 @@ HYDRA21 PDF Compressor Pro - Complete Professional Main Window
 Full PDF processing suite with tabbed interface and modern design
 """
 
+import asyncio
 import flet as ft
+import logging
+import queue
 import threading
 import time
 import subprocess
+import shutil
 import os
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, List, Dict, Optional, Tuple
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache, partial
 
 # Core imports
 from config.settings import get_app_config, DirectoryConfig, GS_QUALITY_PRESETS
@@ -20,6 +30,134 @@ from config.ghostscript_config import GhostscriptConfig
 from ui.components.tabbed_interface import TabbedInterface
 from ui.components.pdf_splitter import PDFSplitter
 from ui.components.pdf_merger import PDFMerger
+from utils.helpers import LatestValue, run_blocking, run_on_ui
+
+logger = logging.getLogger(__name__)
+
+# Spacing shared by every card and history entry
+CARD_MARGIN = ft.margin.only(bottom=24)
+HISTORY_ITEM_MARGIN = ft.margin.only(bottom=6)
+
+# File list rows sent per update, and the pause between chunks (one frame)
+FILE_ROWS_PER_FRAME = 50
+FRAME_INTERVAL = 0.016
+
+# Paddings shared by buttons, sections and badges
+BUTTON_PADDING = ft.padding.symmetric(horizontal=20, vertical=12)
+SMALL_BUTTON_PADDING = ft.padding.symmetric(horizontal=12, vertical=6)
+DIALOG_BUTTON_PADDING = ft.padding.symmetric(horizontal=16, vertical=8)
+SECTION_PADDING = ft.padding.symmetric(horizontal=24, vertical=16)
+BADGE_PADDING = ft.padding.symmetric(horizontal=8, vertical=2)
+
+@lru_cache(maxsize=None)
+def _border_all(color: str) -> ft.Border:
+    """One-pixel border on every side, shared per color"""
+    return ft.border.all(1, color)
+
+@lru_cache(maxsize=None)
+def _border_top(color: str) -> ft.Border:
+    """One-pixel top divider, shared per color"""
+    return ft.border.only(top=ft.BorderSide(1, color))
+
+@lru_cache(maxsize=None)
+def _border_bottom(color: str) -> ft.Border:
+    """Two-pixel bottom divider, shared per color"""
+    return ft.border.only(bottom=ft.BorderSide(2, color))
+
+# Enhanced quality settings for Ghostscript, shared by every compression
+COMPRESSION_QUALITY_SETTINGS = MappingProxyType({
+    "high": {
+        "dPDFSETTINGS": "/printer",
+        "dColorImageResolution": "150",
+        "dGrayImageResolution": "150",
+        "dMonoImageResolution": "300",
+        "dColorImageDownsampleType": "/Bicubic"
+    },
+    "medium": {
+        "dPDFSETTINGS": "/ebook",
+        "dColorImageResolution": "72",
+        "dGrayImageResolution": "72",
+        "dMonoImageResolution": "150",
+        "dColorImageDownsampleType": "/Average"
+    },
+    "low": {
+        "dPDFSETTINGS": "/screen",
+        "dColorImageResolution": "36",
+        "dGrayImageResolution": "36",
+        "dMonoImageResolution": "72",
+        "dColorImageDownsampleType": "/Subsample"
+    }
+})
+
+# Window palettes, indexed by the dark-mode flag
+WINDOW_THEMES = (
+    MappingProxyType({
+        'surface': '#ffffff',
+        'surface_variant': '#f8fafc',
+        'on_surface': '#1e293b',
+        'on_surface_variant': '#64748b',
+        'outline': '#e2e8f0',
+        'primary': '#2563eb',
+        'on_primary': '#ffffff'
+    }),
+    MappingProxyType({
+        'surface': '#1e293b',
+        'surface_variant': '#334155',
+        'on_surface': '#f1f5f9',
+        'on_surface_variant': '#cbd5e1',
+        'outline': '#475569',
+        'primary': '#3b82f6',
+        'on_primary': '#ffffff'
+    })
+)
+
+# Ghostscript status badge styles
+GS_STATUS_STYLES = MappingProxyType({
+    'found': MappingProxyType({
+        'icon': ft.Icons.CHECK_CIRCLE, 'color': "#059669", 'bgcolor': "#ecfdf5", 'border': "#a7f3d0"
+    }),
+    'missing': MappingProxyType({
+        'icon': ft.Icons.WARNING, 'color': "#f59e0b", 'bgcolor': "#fffbeb", 'border': "#fed7aa"
+    }),
+    'detecting': MappingProxyType({
+        'icon': ft.Icons.HOURGLASS_EMPTY, 'color': "#64748b", 'bgcolor': "#f1f5f9", 'border': "#e2e8f0"
+    })
+})
+
+# Help text shown under the quality dropdown
+QUALITY_DESCRIPTIONS = MappingProxyType({
+    "high": "Mejor calidad visual, archivos más grandes. Ideal para documentos que se van a imprimir.",
+    "medium": "Balance entre calidad y tamaño. Recomendado para la mayoría de casos.",
+    "low": "Máxima compresión, menor calidad. Ideal para archivos que solo se verán en pantalla."
+})
+
+# Defaults for the advanced Ghostscript settings; copied per window and on reset
+DEFAULT_GS_ADVANCED_SETTINGS = MappingProxyType({
+    'color_conversion': 'RGB',
+    'image_compression': 'JPEG',
+    'font_embedding': True,
+    'optimize_for': 'web',
+    'preserve_transparency': True,
+    'downsample_images': True
+})
+
+# Executables probed when the configured Ghostscript is not verified
+GS_PROBE_CANDIDATES = (
+    "gswin64c.exe",
+    "gswin32c.exe",
+    "gs",
+    (r"C:\Program Files\gs", "gs*/bin/gswin64c.exe"),
+    (r"C:\Program Files (x86)\gs", "gs*/bin/gswin32c.exe")
+)
+
+@dataclass(frozen=True)
+class CompressionJob:
+    """UI state captured on the event loop when a compression starts"""
+    files: Tuple[Path, ...]
+    sizes: Tuple[int, ...]
+    quality: str
+    gs_path: str
+    output_dir: Path
 
 class MainWindow(ft.Column):
     """Complete Professional PDF Compressor Main Window with Tabbed Interface"""
@@ -42,12 +180,25 @@ class MainWindow(ft.Column):
         self.output_dir = self.dir_config.output_dir / "compressed"
         self.output_dir.mkdir(exist_ok=True)
 
-        # Initialize Ghostscript
+        # Ghostscript is detected in the background once the window is
+        # mounted, so probing never delays the first paint
         self.gs_config = GhostscriptConfig(self.dir_config.config_dir)
-        self.gs_path = self._detect_ghostscript()
+        self.gs_path: Optional[str] = None
+        self._gs_detecting = True
+        # (badge, icon, text, labels) for every Ghostscript status badge
+        self._gs_badges: List[Tuple[ft.Container, ft.Icon, ft.Text, Tuple[str, str, str]]] = []
 
         # UI state
         self.selected_files: List[Path] = []
+        # Sizes read once at selection time
+        self._file_sizes: Dict[Path, int] = {}
+        # Bumped on every file list rebuild to stop stale chunked renders
+        self._file_list_generation = 0
+        # Rows built once per selected file and reused across rebuilds
+        self._file_rows: Dict[Path, ft.Row] = {}
+        # Rows currently in file_list_container, in selection order
+        self._file_rows_rendered = 0
+        self._file_summary_text: Optional[ft.Text] = None
         self.is_processing = False
         self.processing_stats = {}
         self.current_quality = "medium"
@@ -55,14 +206,7 @@ class MainWindow(ft.Column):
         self.operation_history = []
 
         # Advanced Ghostscript settings
-        self.gs_advanced_settings = {
-            'color_conversion': 'RGB',
-            'image_compression': 'JPEG',
-            'font_embedding': True,
-            'optimize_for': 'web',
-            'preserve_transparency': True,
-            'downsample_images': True
-        }
+        self.gs_advanced_settings = dict(DEFAULT_GS_ADVANCED_SETTINGS)
 
         # Theme configuration
         self.theme = self._get_theme_config()
@@ -71,6 +215,10 @@ class MainWindow(ft.Column):
         self.file_picker = None
         self.file_list_container = None
         self.quality_dropdown = None
+        self.quality_description = None
+        # Settings card halves, swapped as Ghostscript detection resolves
+        self._gs_warning_row = None
+        self._quality_settings = None
         self.progress_container = None
         self.results_panel = None
         self.process_button = None
@@ -79,6 +227,25 @@ class MainWindow(ft.Column):
         self.pdf_splitter = None
         self.pdf_merger = None
 
+        # Background jobs run one at a time on a single long-lived worker,
+        # started with the first job
+        self._job_queue: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        self._worker_thread: Optional[threading.Thread] = None
+
+        # Ghostscript compression pool, created once and shared by every batch
+        self._compress_pool: Optional[ThreadPoolExecutor] = None
+        # Futures of the running batch, cancelled on cleanup
+        self._compress_futures: List[Future] = []
+
+        # Controls waiting for the page.update() that closes the open _batch()
+        self._pending_updates: Optional[List[ft.Control]] = None
+
+        # Static dialogs keyed by (name, dark mode), built on first open
+        self._dialog_cache: Dict[Tuple[str, bool], ft.AlertDialog] = {}
+
+        # (control, attribute, resolver) for every theme-dependent property
+        self._themed_controls: List[Tuple[ft.Control, str, Callable[[], Any]]] = []
+
         # Setup UI
         self._setup_ui()
         self._setup_keyboard_shortcuts()
@@ -96,7 +263,7 @@ class MainWindow(ft.Column):
             layout_controls = self._build_layout()
             self.controls.extend(layout_controls)
         except Exception as e:
-            print(f"Error building layout: {e}")
+            logger.error("Error building layout: %s", e)
             # Fallback to simple layout
             self.controls.append(
                 ft.Container(
@@ -105,75 +272,96 @@ class MainWindow(ft.Column):
                 )
             )
 
+    def did_mount(self):
+        """Start Ghostscript detection once the window is on the page"""
+        if self._gs_detecting:
+            self.page.run_task(self._detect_ghostscript_in_background)
+
+    async def _detect_ghostscript_in_background(self):
+        """Detect Ghostscript off the event loop and refresh its status"""
+        self.gs_path = await run_blocking(self._detect_ghostscript)
+        self._gs_detecting = False
+        with self._batch():
+            self._refresh_gs_status()
+            self._update_buttons()
+
     def _get_theme_config(self) -> Dict[str, str]:
-        """Get theme configuration"""
-        if self.is_dark_mode:
-            return {
-                'surface': '#1e293b',
-                'surface_variant': '#334155',
-                'on_surface': '#f1f5f9',
-                'on_surface_variant': '#cbd5e1',
-                'outline': '#475569',
-                'primary': '#3b82f6',
-                'on_primary': '#ffffff'
-            }
-        else:
-            return {
-                'surface': '#ffffff',
-                'surface_variant': '#f8fafc',
-                'on_surface': '#1e293b',
-                'on_surface_variant': '#64748b',
-                'outline': '#e2e8f0',
-                'primary': '#2563eb',
-                'on_primary': '#ffffff'
-            }
+        """Get theme configuration (shared, read-only)"""
+        return WINDOW_THEMES[self.is_dark_mode]
     
     def _detect_ghostscript(self):
         """Detect Ghostscript installation"""
         try:
             gs_info = self.gs_config.get_ghostscript_info()
             if gs_info['verified']:
-                print(f"✅ Ghostscript encontrado: {gs_info['path']}")
+                logger.info("Ghostscript encontrado: %s", gs_info['path'])
                 return gs_info['path']
             else:
                 # Try common paths
-                common_paths = [
-                    "gswin64c.exe",
-                    "gswin32c.exe", 
-                    "gs",
-                    r"C:\Program Files\gs\gs*\bin\gswin64c.exe",
-                    r"C:\Program Files (x86)\gs\gs*\bin\gswin32c.exe"
-                ]
-                
-                for path in common_paths:
+                for candidate in GS_PROBE_CANDIDATES:
                     try:
-                        if "*" in path:
-                            # Handle wildcard paths
-                            import glob
-                            matches = glob.glob(path)
-                            if matches:
-                                path = matches[0]
+                        if isinstance(candidate, tuple):
+                            # Versioned install dir: stop at the first match
+                            base, pattern = candidate
+                            match = next(Path(base).glob(pattern), None)
+                            if match is None:
+                                continue
+                            path = str(match)
+                        elif shutil.which(candidate) is None:
+                            # Not in PATH, no need to spawn a probe
+                            continue
+                        else:
+                            path = candidate
                         
                         result = subprocess.run([path, "--version"], 
-                                              capture_output=True, text=True, timeout=5)
+                                              capture_output=True, text=True, timeout=2)
                         if result.returncode == 0:
-                            print(f"✅ Ghostscript encontrado: {path}")
+                            logger.info("Ghostscript encontrado: %s", path)
+                            # Persist it so the next launch verifies this path
+                            # instead of probing again
+                            self.gs_config.gs_path = path
                             return path
                     except:
                         continue
                 
-                print("⚠️ Ghostscript no encontrado - funcionalidad limitada")
+                logger.warning("Ghostscript no encontrado - funcionalidad limitada")
                 return None
         except Exception as e:
-            print(f"⚠️ Error detectando Ghostscript: {e}")
+            logger.warning("Error detectando Ghostscript: %s", e)
             return None
     
+    def _themed(self, control, **resolvers):
+        """Register theme-dependent attributes of a control
+        
+        Args:
+            control: Control to register
+            **resolvers: Attribute name mapped to a callable returning its value
+                for the current theme
+            
+        Returns:
+            The control, with the attributes set for the current theme
+        """
+        for attr, resolve in resolvers.items():
+            setattr(control, attr, resolve())
+            self._themed_controls.append((control, attr, resolve))
+        return control
+    
+    def _apply_theme_to_controls(self):
+        """Re-resolve every registered theme-dependent attribute in place"""
+        for control, attr, resolve in self._themed_controls:
+            setattr(control, attr, resolve())
+    
     def _setup_ui(self):
         """Setup UI components"""
         # File picker
         self.file_picker = ft.FilePicker(on_result=self._on_files_selected)
         self.page.overlay.append(self.file_picker)
 
+        # One snack bar for every notification; only its text and color change
+        self._snack_text = ft.Text("")
+        self._snack_bar = ft.SnackBar(content=self._snack_text)
+        self.page.overlay.append(self._snack_bar)
+
         # Create tabbed interface
         self.tabbed_interface = TabbedInterface(self.page, self.theme)
 
@@ -191,6 +379,13 @@ class MainWindow(ft.Column):
             on_merge_complete=self._on_merge_complete
         )
 
+        # Help text for the selected quality, refreshed in place on change
+        self.quality_description = ft.Text(
+            self._get_quality_description(),
+            size=12,
+            color="#64748b"
+        )
+
         # Quality dropdown
         self.quality_dropdown = ft.Dropdown(
             label="Calidad de Compresión",
@@ -201,10 +396,13 @@ class MainWindow(ft.Column):
                 ft.dropdown.Option("low", "Baja Calidad - Máxima compresión (36 DPI)"),
             ],
             width=500,
-            bgcolor=self.theme['surface'],
-            border_color=self.theme['outline'],
             on_change=self._on_quality_changed
         )
+        self._themed(
+            self.quality_dropdown,
+            bgcolor=lambda: self.theme['surface'],
+            border_color=lambda: self.theme['outline']
+        )
         
         # File list container
         self.file_list_container = ft.Column(spacing=8)
@@ -228,7 +426,7 @@ class MainWindow(ft.Column):
                             ft.ProgressRing(visible=False, color="#2563eb", width=24, height=24),
                             ft.Text("", size=14, color="#2563eb", expand=True)
                         ], spacing=12),
-                        ft.Text("", size=12, color=self._get_secondary_text_color())
+                        self._themed(ft.Text("", size=12), color=self._get_secondary_text_color)
                     ], spacing=8),
                     visible=False
                 )
@@ -269,7 +467,7 @@ class MainWindow(ft.Column):
                         style=ft.ButtonStyle(
                             bgcolor="#059669",
                             color="white",
-                            padding=ft.padding.symmetric(horizontal=20, vertical=12)
+                            padding=BUTTON_PADDING
                         )
                     ),
                     ft.ElevatedButton(
@@ -279,7 +477,7 @@ class MainWindow(ft.Column):
                         style=ft.ButtonStyle(
                             bgcolor="#3b82f6",
                             color="white",
-                            padding=ft.padding.symmetric(horizontal=20, vertical=12)
+                            padding=BUTTON_PADDING
                         )
                     ),
                     ft.ElevatedButton(
@@ -289,7 +487,7 @@ class MainWindow(ft.Column):
                         style=ft.ButtonStyle(
                             bgcolor="#2563eb",
                             color="white",
-                            padding=ft.padding.symmetric(horizontal=20, vertical=12)
+                            padding=BUTTON_PADDING
                         )
                     )
                 ], spacing=12, alignment=ft.MainAxisAlignment.CENTER)
@@ -322,7 +520,7 @@ class MainWindow(ft.Column):
             style=ft.ButtonStyle(
                 bgcolor="#f1f5f9",
                 color="#2563eb",
-                padding=ft.padding.symmetric(horizontal=24, vertical=16)
+                padding=SECTION_PADDING
             )
         )
     
@@ -333,97 +531,98 @@ class MainWindow(ft.Column):
 
         return [
             # Header
-            ft.Container(
-                content=ft.Row([
-                    ft.Row([
-                        # Logo
-                        ft.Container(
-                            content=ft.Image(
-                                src="logo.png",
+            self._themed(
+                ft.Container(
+                    content=ft.Row([
+                        ft.Row([
+                            # Logo
+                            ft.Container(
+                                content=ft.Image(
+                                    src="logo.png",
+                                    width=32,
+                                    height=32,
+                                    fit=ft.ImageFit.CONTAIN
+                                ),
                                 width=32,
                                 height=32,
-                                fit=ft.ImageFit.CONTAIN
-                            ),
-                            width=32,
-                            height=32,
-                            border_radius=4
-                        ),
-                        ft.Column([
-                            ft.Text(
-                                "HYDRA21 PDF Compressor Pro",
-                                size=24,
-                                weight=ft.FontWeight.BOLD,
-                                color="#2563eb"
+                                border_radius=4
                             ),
-                            ft.Text(
-                                "Suite Profesional de Procesamiento de PDFs",
-                                size=14,
-                                color=self._get_secondary_text_color()
-                            )
-                        ], spacing=2)
-                    ], spacing=16),
-
-                    # Header actions
-                    ft.Row([
-                        # Ghostscript status
-                        ft.Container(
-                            content=ft.Row([
-                                ft.Icon(
-                                    ft.Icons.CHECK_CIRCLE if self.gs_path else ft.Icons.WARNING,
-                                    color="#059669" if self.gs_path else "#f59e0b",
-                                    size=16
-                                ),
+                            ft.Column([
                                 ft.Text(
-                                    "GS OK" if self.gs_path else "GS Missing",
-                                    size=11,
-                                    color="#059669" if self.gs_path else "#f59e0b",
-                                    weight=ft.FontWeight.W_500
+                                    "HYDRA21 PDF Compressor Pro",
+                                    size=24,
+                                    weight=ft.FontWeight.BOLD,
+                                    color="#2563eb"
+                                ),
+                                self._themed(
+                                    ft.Text("Suite Profesional de Procesamiento de PDFs", size=14),
+                                    color=self._get_secondary_text_color
                                 )
-                            ], spacing=6),
-                            padding=ft.padding.symmetric(horizontal=10, vertical=4),
-                            bgcolor="#ecfdf5" if self.gs_path else "#fffbeb",
-                            border_radius=16,
-                            border=ft.border.all(1, "#a7f3d0" if self.gs_path else "#fed7aa")
-                        ),
+                            ], spacing=2)
+                        ], spacing=16),
 
-                        # Action buttons
-                        ft.IconButton(
-                            icon=ft.Icons.HISTORY,
-                            tooltip="Historial de operaciones",
-                            on_click=self._show_history,
-                            icon_color=self._get_icon_color()
-                        ),
-                        ft.IconButton(
-                            icon=ft.Icons.HELP_OUTLINE,
-                            tooltip="Ayuda y tutorial",
-                            on_click=self._show_help,
-                            icon_color=self._get_icon_color()
-                        ),
-                        ft.IconButton(
-                            icon=ft.Icons.SETTINGS,
-                            tooltip="Configuración",
-                            on_click=self._show_settings,
-                            icon_color=self._get_icon_color()
-                        ),
-                        ft.IconButton(
-                            icon=ft.Icons.DARK_MODE if not self.is_dark_mode else ft.Icons.LIGHT_MODE,
-                            tooltip="Cambiar tema",
-                            on_click=self._toggle_theme,
-                            icon_color=self._get_icon_color()
-                        )
-                    ], spacing=8)
-                ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-                padding=24,
-                bgcolor=self._get_header_bg_color(),
-                border=ft.border.only(bottom=ft.BorderSide(2, self._get_border_color()))
+                        # Header actions
+                        ft.Row([
+                            # Ghostscript status
+                            self._create_gs_badge(
+                                ("GS OK", "GS Missing", "GS..."),
+                                icon_size=16,
+                                text_size=11,
+                                padding=ft.padding.symmetric(horizontal=10, vertical=4),
+                                border_radius=16,
+                                spacing=6,
+                                text_weight=ft.FontWeight.W_500
+                            ),
+
+                            # Action buttons
+                            self._themed(
+                                ft.IconButton(
+                                    icon=ft.Icons.HISTORY,
+                                    tooltip="Historial de operaciones",
+                                    on_click=self._show_history
+                                ),
+                                icon_color=self._get_icon_color
+                            ),
+                            self._themed(
+                                ft.IconButton(
+                                    icon=ft.Icons.HELP_OUTLINE,
+                                    tooltip="Ayuda y tutorial",
+                                    on_click=self._show_help
+                                ),
+                                icon_color=self._get_icon_color
+                            ),
+                            self._themed(
+                                ft.IconButton(
+                                    icon=ft.Icons.SETTINGS,
+                                    tooltip="Configuración",
+                                    on_click=self._show_settings
+                                ),
+                                icon_color=self._get_icon_color
+                            ),
+                            self._themed(
+                                ft.IconButton(
+                                    tooltip="Cambiar tema",
+                                    on_click=self._toggle_theme
+                                ),
+                                icon=lambda: ft.Icons.LIGHT_MODE if self.is_dark_mode else ft.Icons.DARK_MODE,
+                                icon_color=self._get_icon_color
+                            )
+                        ], spacing=8)
+                    ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                    padding=24
+                ),
+                bgcolor=self._get_header_bg_color,
+                border=lambda: _border_bottom(self._get_border_color())
             ),
 
             # Tabbed interface
-            ft.Container(
-                content=self.tabbed_interface,
-                padding=ft.padding.symmetric(horizontal=24, vertical=16),
-                expand=True,
-                bgcolor=self._get_bg_color()
+            self._themed(
+                ft.Container(
+                    content=self.tabbed_interface,
+                    padding=SECTION_PADDING,
+                    expand=True
+                ),
+                bgcolor=self._get_bg_color
             ),
 
             # Footer
@@ -477,7 +676,7 @@ class MainWindow(ft.Column):
             'output_path': str(result.output_path) if result.output_path else None
         })
 
-        print(f"✅ División completada: {result.message}")
+        logger.debug("División completada: %s", result.message)
 
     def _on_merge_complete(self, result):
         """Handle PDF merge completion"""
@@ -490,7 +689,7 @@ class MainWindow(ft.Column):
             'output_path': str(result.output_path) if result.output_path else None
         })
 
-        print(f"✅ Fusión completada: {result.message}")
+        logger.debug("Fusión completada: %s", result.message)
 
     def _get_header_bg_color(self):
         """Get header background color based on theme"""
@@ -501,113 +700,112 @@ class MainWindow(ft.Column):
         return self._create_card([
             ft.Row([
                 ft.Icon(ft.Icons.FOLDER_OPEN, color="#2563eb", size=24),
-                ft.Text(
-                    "Selección de Archivos PDF",
-                    size=18,
-                    weight=ft.FontWeight.W_600,
-                    color=self._get_text_color()
+                self._themed(
+                    ft.Text("Selección de Archivos PDF", size=18, weight=ft.FontWeight.W_600),
+                    color=self._get_text_color
                 )
             ], spacing=12),
 
             ft.Container(height=16),
 
             # File selection area with drag-and-drop
-            ft.Container(
-                content=ft.Column([
-                    # Drag and drop area
-                    ft.Container(
-                        content=ft.Column([
-                            ft.Icon(ft.Icons.CLOUD_UPLOAD, size=48, color="#2563eb"),
-                            ft.Text(
-                                "Arrastra archivos PDF aquí",
-                                size=16,
-                                weight=ft.FontWeight.W_500,
-                                color="#2563eb"
-                            ),
-                            ft.Text(
-                                "o haz clic para seleccionar",
-                                size=14,
-                                color="#64748b"
-                            )
-                        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=8),
-                        padding=32,
-                        border=ft.border.all(2, "#2563eb"),
-                        border_radius=12,
-                        bgcolor="#f0f9ff",
-                        on_click=self._select_files
-                    ),
+            self._themed(
+                ft.Container(
+                    content=ft.Column([
+                        # Drag and drop area
+                        ft.Container(
+                            content=ft.Column([
+                                ft.Icon(ft.Icons.CLOUD_UPLOAD, size=48, color="#2563eb"),
+                                ft.Text(
+                                    "Arrastra archivos PDF aquí",
+                                    size=16,
+                                    weight=ft.FontWeight.W_500,
+                                    color="#2563eb"
+                                ),
+                                ft.Text(
+                                    "o haz clic para seleccionar",
+                                    size=14,
+                                    color="#64748b"
+                                )
+                            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=8),
+                            padding=32,
+                            border=ft.border.all(2, "#2563eb"),
+                            border_radius=12,
+                            bgcolor="#f0f9ff",
+                            on_click=self._select_files
+                        ),
 
-                    ft.Container(height=16),
+                        ft.Container(height=16),
 
-                    ft.Row([
-                        ft.ElevatedButton(
-                            text="Seleccionar Archivos",
-                            icon=ft.Icons.FOLDER_OPEN,
-                            on_click=self._select_files,
-                            style=ft.ButtonStyle(
-                                bgcolor="#2563eb",
-                                color="white",
-                                padding=ft.padding.symmetric(horizontal=20, vertical=12)
-                            )
-                        ),
-                        ft.ElevatedButton(
-                            text="Ejemplo Demo",
-                            icon=ft.Icons.PLAY_ARROW,
-                            on_click=self._load_demo_files,
-                            style=ft.ButtonStyle(
-                                bgcolor="#059669",
-                                color="white",
-                                padding=ft.padding.symmetric(horizontal=20, vertical=12)
+                        ft.Row([
+                            ft.ElevatedButton(
+                                text="Seleccionar Archivos",
+                                icon=ft.Icons.FOLDER_OPEN,
+                                on_click=self._select_files,
+                                style=ft.ButtonStyle(
+                                    bgcolor="#2563eb",
+                                    color="white",
+                                    padding=BUTTON_PADDING
+                                )
+                            ),
+                            ft.ElevatedButton(
+                                text="Ejemplo Demo",
+                                icon=ft.Icons.PLAY_ARROW,
+                                on_click=self._load_demo_files,
+                                style=ft.ButtonStyle(
+                                    bgcolor="#059669",
+                                    color="white",
+                                    padding=BUTTON_PADDING
+                                )
                             )
-                        )
-                    ], spacing=12, alignment=ft.MainAxisAlignment.CENTER),
-
-                    ft.Container(height=16),
-                    self.file_list_container
-                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                padding=24,
-                border=ft.border.all(1, "#e2e8f0"),
-                border_radius=12,
-                bgcolor=self._get_surface_color()
+                        ], spacing=12, alignment=ft.MainAxisAlignment.CENTER),
+
+                        ft.Container(height=16),
+                        self.file_list_container
+                    ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+                    padding=24,
+                    border=ft.border.all(1, "#e2e8f0"),
+                    border_radius=12
+                ),
+                bgcolor=self._get_surface_color
             )
         ])
 
     def _create_settings_section(self):
-        """Create settings section"""
-        if not self.gs_path:
-            return self._create_card([
-                ft.Row([
-                    ft.Icon(ft.Icons.WARNING, color="#f59e0b", size=24),
-                    ft.Column([
-                        ft.Text(
-                            "Ghostscript Requerido",
-                            size=16,
-                            weight=ft.FontWeight.W_600,
-                            color="#f59e0b"
-                        ),
-                        ft.Text(
-                            "Instala Ghostscript para habilitar la compresión de PDFs",
-                            size=14,
-                            color="#64748b"
-                        ),
-                        ft.Container(height=8),
-                        ft.Text(
-                            "Descarga desde: https://www.ghostscript.com/download/gsdnld.html",
-                            size=12,
-                            color="#2563eb"
-                        )
-                    ], spacing=4, expand=True)
-                ], alignment=ft.MainAxisAlignment.START)
-            ])
+        """Create settings section
+        
+        Holds both the missing-Ghostscript warning and the quality controls;
+        _refresh_gs_status shows the one matching the detection result.
+        """
+        self._gs_warning_row = ft.Row([
+            ft.Icon(ft.Icons.WARNING, color="#f59e0b", size=24),
+            ft.Column([
+                ft.Text(
+                    "Ghostscript Requerido",
+                    size=16,
+                    weight=ft.FontWeight.W_600,
+                    color="#f59e0b"
+                ),
+                ft.Text(
+                    "Instala Ghostscript para habilitar la compresión de PDFs",
+                    size=14,
+                    color="#64748b"
+                ),
+                ft.Container(height=8),
+                ft.Text(
+                    "Descarga desde: https://www.ghostscript.com/download/gsdnld.html",
+                    size=12,
+                    color="#2563eb"
+                )
+            ], spacing=4, expand=True)
+        ], alignment=ft.MainAxisAlignment.START)
 
-        return self._create_card([
+        self._quality_settings = ft.Column([
             ft.Row([
                 ft.Icon(ft.Icons.TUNE, color="#2563eb", size=24),
-                ft.Text(
-                    "Configuración de Compresión",
-                    size=18,
-                    weight=ft.FontWeight.W_600,
-                    color=self._get_text_color()
+                self._themed(
+                    ft.Text("Configuración de Compresión", size=18, weight=ft.FontWeight.W_600),
+                    color=self._get_text_color
                 )
             ], spacing=12),
 
@@ -615,12 +813,17 @@ class MainWindow(ft.Column):
             self.quality_dropdown,
 
             ft.Container(height=12),
-            ft.Text(
-                self._get_quality_description(),
-                size=12,
-                color="#64748b"
-            )
-        ])
+            self.quality_description
+        ], spacing=0)
+
+        self._set_settings_visibility()
+        return self._create_card([self._gs_warning_row, self._quality_settings])
+
+    def _set_settings_visibility(self):
+        """Show the warning only once detection has found no Ghostscript"""
+        missing = not self._gs_detecting and not self.gs_path
+        self._gs_warning_row.visible = missing
+        self._quality_settings.visible = not missing
 
     def _create_action_section(self):
         """Create action buttons section"""
@@ -631,14 +834,16 @@ class MainWindow(ft.Column):
 
     def _create_card(self, content):
         """Create a styled card container with theme support"""
-        return ft.Container(
-            content=ft.Column(content, spacing=0),
-            padding=24,
-            bgcolor=self._get_card_bg_color(),
-            border_radius=12,
-            border=ft.border.all(1, self._get_border_color()),
-            width=750,  # Reduced width for new window size
-            margin=ft.margin.only(bottom=24)
+        return self._themed(
+            ft.Container(
+                content=ft.Column(content, spacing=0),
+                padding=24,
+                border_radius=12,
+                width=750,  # Reduced width for new window size
+                margin=CARD_MARGIN
+            ),
+            bgcolor=self._get_card_bg_color,
+            border=lambda: _border_all(self._get_border_color())
         )
 
     def _get_card_bg_color(self):
@@ -649,55 +854,106 @@ class MainWindow(ft.Column):
         """Get border color based on theme"""
         return "#374151" if self.is_dark_mode else "#e2e8f0"
 
+    def _create_gs_badge(
+        self,
+        labels: Tuple[str, str, str],
+        icon_size: int,
+        text_size: int,
+        padding: ft.Padding,
+        border_radius: int,
+        spacing: int,
+        text_weight: Optional[ft.FontWeight] = None
+    ) -> ft.Container:
+        """Create a Ghostscript status badge that follows detection
+
+        Args:
+            labels: Texts for the found, missing and detecting states
+            icon_size: Status icon size
+            text_size: Label size
+            padding: Badge padding
+            border_radius: Badge corner radius
+            spacing: Gap between icon and label
+            text_weight: Label weight
+
+        Returns:
+            The badge container
+        """
+        icon = ft.Icon(size=icon_size)
+        text = ft.Text(size=text_size, weight=text_weight)
+        badge = ft.Container(
+            content=ft.Row([icon, text], spacing=spacing),
+            padding=padding,
+            border_radius=border_radius
+        )
+        self._gs_badges.append((badge, icon, text, labels))
+        self._style_gs_badge(badge, icon, text, labels)
+        return badge
+
+    def _style_gs_badge(self, badge, icon, text, labels):
+        """Apply the current Ghostscript state to one badge"""
+        if self._gs_detecting:
+            state, label = GS_STATUS_STYLES['detecting'], labels[2]
+        elif self.gs_path:
+            state, label = GS_STATUS_STYLES['found'], labels[0]
+        else:
+            state, label = GS_STATUS_STYLES['missing'], labels[1]
+
+        icon.name = state['icon']
+        icon.color = state['color']
+        text.value = label
+        text.color = state['color']
+        badge.bgcolor = state['bgcolor']
+        badge.border = _border_all(state['border'])
+
+    def _refresh_gs_status(self):
+        """Restyle every Ghostscript status badge and send them"""
+        for badge, icon, text, labels in self._gs_badges:
+            self._style_gs_badge(badge, icon, text, labels)
+        self._update_controls(*(entry[0] for entry in self._gs_badges))
+        if self._gs_warning_row is not None:
+            self._set_settings_visibility()
+            self._update_controls(self._gs_warning_row, self._quality_settings)
+
     def _create_footer(self):
         """Create footer with version and theme info"""
-        return ft.Container(
-            content=ft.Row([
-                # Left side - Version info
-                ft.Row([
-                    ft.Text(
-                        "HYDRA²¹",
-                        size=12,
-                        weight=ft.FontWeight.BOLD,
-                        color="#2563eb"
-                    ),
-                    ft.Text(
-                        "PDF Compressor Pro v0.5.0",
-                        size=11,
-                        color=self._get_secondary_text_color()
-                    )
-                ], spacing=8),
+        return self._themed(
+            ft.Container(
+                content=ft.Row([
+                    # Left side - Version info
+                    ft.Row([
+                        ft.Text(
+                            "HYDRA²¹",
+                            size=12,
+                            weight=ft.FontWeight.BOLD,
+                            color="#2563eb"
+                        ),
+                        self._themed(
+                            ft.Text("PDF Compressor Pro v0.5.0", size=11),
+                            color=self._get_secondary_text_color
+                        )
+                    ], spacing=8),
 
-                # Right side - Theme and status
-                ft.Row([
-                    ft.Text(
-                        f"Tema: {'Oscuro' if self.is_dark_mode else 'Claro'}",
-                        size=11,
-                        color=self._get_secondary_text_color()
-                    ),
-                    ft.Container(
-                        content=ft.Row([
-                            ft.Icon(
-                                ft.Icons.CHECK_CIRCLE if self.gs_path else ft.Icons.WARNING,
-                                color="#059669" if self.gs_path else "#f59e0b",
-                                size=12
-                            ),
-                            ft.Text(
-                                "Ghostscript OK" if self.gs_path else "Ghostscript Missing",
-                                size=10,
-                                color="#059669" if self.gs_path else "#f59e0b"
-                            )
-                        ], spacing=4),
-                        padding=ft.padding.symmetric(horizontal=8, vertical=2),
-                        bgcolor="#ecfdf5" if self.gs_path else "#fffbeb",
-                        border_radius=8,
-                        border=ft.border.all(1, "#a7f3d0" if self.gs_path else "#fed7aa")
-                    )
-                ], spacing=12)
-            ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-            padding=ft.padding.symmetric(horizontal=24, vertical=8),
-            bgcolor=self._get_header_bg_color(),
-            border=ft.border.only(top=ft.BorderSide(1, self._get_border_color()))
+                    # Right side - Theme and status
+                    ft.Row([
+                        self._themed(
+                            ft.Text(size=11),
+                            value=lambda: f"Tema: {'Oscuro' if self.is_dark_mode else 'Claro'}",
+                            color=self._get_secondary_text_color
+                        ),
+                        self._create_gs_badge(
+                            ("Ghostscript OK", "Ghostscript Missing", "Buscando Ghostscript..."),
+                            icon_size=12,
+                            text_size=10,
+                            padding=BADGE_PADDING,
+                            border_radius=8,
+                            spacing=4
+                        )
+                    ], spacing=12)
+                ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                padding=ft.padding.symmetric(horizontal=24, vertical=8)
+            ),
+            bgcolor=self._get_header_bg_color,
+            border=lambda: _border_top(self._get_border_color())
         )
 
     # Event handlers
@@ -709,21 +965,47 @@ class MainWindow(ft.Column):
             dialog_title="Seleccionar archivos PDF para comprimir"
         )
 
-    def _on_files_selected(self, e):
-        """Handle file selection"""
+    async def _on_files_selected(self, e):
+        """Handle file selection, reading file sizes concurrently off the event loop"""
         if e.files:
-            self.selected_files = [Path(f.path) for f in e.files]
-            self._update_file_list()
-            self._update_buttons()
+            paths = [Path(f.path) for f in e.files]
+            sizes = await asyncio.gather(*(run_blocking(self._read_file_size, p) for p in paths))
+
+            # Files that can no longer be read are left out of the selection
+            previous_sizes = self._file_sizes
+            self._file_sizes = {p: size for p, size in zip(paths, sizes) if size is not None}
+            self.selected_files = list(self._file_sizes)
+            # Keep the rows of files still selected with an unchanged size
+            self._file_rows = {
+                path: row for path, row in self._file_rows.items()
+                if previous_sizes.get(path) == self._file_sizes.get(path)
+            }
+            with self._batch():
+                self._update_file_list()
+                self._update_buttons()
+
+    @staticmethod
+    def _read_file_size(path: Path) -> Optional[int]:
+        """Get a file's size in bytes, or None if it cannot be read"""
+        try:
+            return path.stat().st_size
+        except OSError as ex:
+            logger.warning("Error reading file %s: %s", path, ex)
+            return None
 
     def _on_quality_changed(self, e):
         """Handle quality dropdown change"""
         self.current_quality = e.control.value
-        self.update()
+        self.quality_description.value = self._get_quality_description()
+        self._update_controls(self.quality_description)
 
     def _update_file_list(self):
         """Update the file list display"""
+        # Invalidates rows still being rendered for an older selection
+        self._file_list_generation += 1
         self.file_list_container.controls.clear()
+        self._file_rows_rendered = 0
+        self._file_summary_text = None
 
         if not self.selected_files:
             self.file_list_container.controls.append(
@@ -736,83 +1018,176 @@ class MainWindow(ft.Column):
             )
         else:
             # Summary
-            total_size = sum(f.stat().st_size for f in self.selected_files)
-            self.file_list_container.controls.append(
-                ft.Text(
-                    f"✅ {len(self.selected_files)} archivo(s) seleccionado(s) - {total_size / (1024*1024):.1f} MB total",
-                    size=14,
-                    weight=ft.FontWeight.W_500,
-                    color="#059669"
-                )
+            self._file_summary_text = ft.Text(
+                self._file_summary(),
+                size=14,
+                weight=ft.FontWeight.W_500,
+                color="#059669"
             )
+            self.file_list_container.controls.append(self._file_summary_text)
 
             self.file_list_container.controls.append(ft.Container(height=8))
 
-            # File list
-            for i, file_path in enumerate(self.selected_files):
-                try:
-                    file_size = file_path.stat().st_size / (1024*1024)
-                    self.file_list_container.controls.append(
-                        ft.Row([
-                            ft.Text(f"{i+1}.", size=12, color=self._get_secondary_text_color(), width=30),
-                            ft.Icon(ft.Icons.PICTURE_AS_PDF, color="#dc2626", size=16),
-                            ft.Text(
-                                file_path.name,
-                                size=13,
-                                color=self._get_text_color(),
-                                expand=True,
-                                overflow=ft.TextOverflow.ELLIPSIS
-                            ),
-                            ft.Text(
-                                f"{file_size:.1f} MB",
-                                size=12,
-                                color="#64748b",
-                                width=60
-                            ),
-                            ft.IconButton(
-                                icon=ft.Icons.CLOSE,
-                                icon_size=16,
-                                on_click=lambda e, idx=i: self._remove_file(idx),
-                                icon_color="#dc2626",
-                                tooltip="Remover archivo"
-                            )
-                        ], spacing=8)
-                    )
-                except Exception as ex:
-                    print(f"Error reading file {file_path}: {ex}")
-
-        self.update()
-
-    def _remove_file(self, index):
-        """Remove file from selection"""
-        if 0 <= index < len(self.selected_files):
-            self.selected_files.pop(index)
-            self._update_file_list()
+            # Large selections are rendered in frame-sized chunks so one
+            # update never carries hundreds of rows
+            self._append_file_rows()
+            if len(self.selected_files) > FILE_ROWS_PER_FRAME:
+                self.page.run_task(self._render_remaining_file_rows, self._file_list_generation)
+
+        self._update_controls(self.file_list_container)
+
+    def _file_summary(self) -> str:
+        """Summary line for the current selection"""
+        total_size = sum(self._file_sizes[f] for f in self.selected_files)
+        return f"✅ {len(self.selected_files)} archivo(s) seleccionado(s) - {total_size / (1024*1024):.1f} MB total"
+
+    def _append_file_rows(self):
+        """Append up to one frame's worth of the rows not rendered yet"""
+        start = self._file_rows_rendered
+        end = min(start + FILE_ROWS_PER_FRAME, len(self.selected_files))
+        for i in range(start, end):
+            row = self._file_row(self.selected_files[i])
+            row.controls[0].value = f"{i+1}."
+            self.file_list_container.controls.append(row)
+        self._file_rows_rendered = end
+
+    def _file_row(self, file_path: Path) -> ft.Row:
+        """Get the row for a selected file, building it on first use"""
+        row = self._file_rows.get(file_path)
+        if row is None:
+            file_size = self._file_sizes[file_path] / (1024*1024)
+            row = ft.Row([
+                ft.Text("", size=12, color=self._get_secondary_text_color(), width=30),
+                ft.Icon(ft.Icons.PICTURE_AS_PDF, color="#dc2626", size=16),
+                ft.Text(
+                    file_path.name,
+                    size=13,
+                    color=self._get_text_color(),
+                    expand=True,
+                    overflow=ft.TextOverflow.ELLIPSIS
+                ),
+                ft.Text(
+                    f"{file_size:.1f} MB",
+                    size=12,
+                    color="#64748b",
+                    width=60
+                ),
+                ft.IconButton(
+                    icon=ft.Icons.CLOSE,
+                    icon_size=16,
+                    on_click=partial(self._remove_file_event, file_path),
+                    icon_color="#dc2626",
+                    tooltip="Remover archivo"
+                )
+            ], spacing=8)
+            self._file_rows[file_path] = row
+        return row
+
+    def _recolor_file_rows(self):
+        """Apply the current theme's text colors to the cached file rows"""
+        text_color = self._get_text_color()
+        secondary_color = self._get_secondary_text_color()
+        for row in self._file_rows.values():
+            row.controls[0].color = secondary_color
+            row.controls[2].color = text_color
+
+    async def _render_remaining_file_rows(self, generation: int):
+        """Render the rows past the first frame, one chunk per frame"""
+        while self._file_rows_rendered < len(self.selected_files):
+            await asyncio.sleep(FRAME_INTERVAL)
+            if generation != self._file_list_generation:
+                # The list was rebuilt; the newer render owns the container
+                return
+            self._append_file_rows()
+            self._update_controls(self.file_list_container)
+
+    def _remove_file_event(self, file_path: Path, e):
+        """Handle a row's remove button"""
+        self._remove_file(file_path)
+
+    def _remove_file(self, file_path: Path):
+        """Remove a file from the selection, editing the list in place"""
+        if file_path not in self._file_sizes:
+            return
+        index = self.selected_files.index(file_path)
+        del self.selected_files[index]
+        del self._file_sizes[file_path]
+        row = self._file_rows.pop(file_path, None)
+
+        with self._batch():
+            if not self.selected_files:
+                self._update_file_list()
+            else:
+                if index < self._file_rows_rendered:
+                    # Drop the row and renumber only the rendered rows after it
+                    self.file_list_container.controls.remove(row)
+                    self._file_rows_rendered -= 1
+                    for i in range(index, self._file_rows_rendered):
+                        self._file_rows[self.selected_files[i]].controls[0].value = f"{i+1}."
+                self._file_summary_text.value = self._file_summary()
+                self._update_controls(self.file_list_container)
             self._update_buttons()
 
     def _update_buttons(self):
-        """Update button states"""
+        """Update button states, skipping the update when nothing changed"""
+        if self._set_button_states():
+            self._update_controls(self.process_button, self.clear_button)
+
+    def _set_button_states(self) -> bool:
+        """Set the action buttons' disabled flags without updating
+
+        Returns:
+            True if either flag changed
+        """
         has_files = len(self.selected_files) > 0
-        self.process_button.disabled = not has_files or not self.gs_path or self.is_processing
-        self.clear_button.disabled = not has_files or self.is_processing
-        self.update()
+        process_disabled = not has_files or not self.gs_path or self.is_processing
+        clear_disabled = not has_files or self.is_processing
+        changed = (self.process_button.disabled != process_disabled
+                   or self.clear_button.disabled != clear_disabled)
+        self.process_button.disabled = process_disabled
+        self.clear_button.disabled = clear_disabled
+        return changed
+
+    @contextmanager
+    def _batch(self):
+        """Collect control updates made inside the block into one page.update()"""
+        if self._pending_updates is not None:
+            # Nested batch; the outermost one flushes
+            yield
+            return
+
+        self._pending_updates = []
+        try:
+            yield
+        finally:
+            pending, self._pending_updates = self._pending_updates, None
+            if pending:
+                self.page.update(*pending)
+
+    def _update_controls(self, *controls: ft.Control):
+        """Send controls now, or when the open _batch() exits"""
+        if self._pending_updates is None:
+            self.page.update(*controls)
+            return
+        for control in controls:
+            if not any(control is queued for queued in self._pending_updates):
+                self._pending_updates.append(control)
 
     def _get_quality_description(self):
         """Get description for current quality setting"""
-        descriptions = {
-            "high": "Mejor calidad visual, archivos más grandes. Ideal para documentos que se van a imprimir.",
-            "medium": "Balance entre calidad y tamaño. Recomendado para la mayoría de casos.",
-            "low": "Máxima compresión, menor calidad. Ideal para archivos que solo se verán en pantalla."
-        }
-        return descriptions.get(self.current_quality, "")
+        return QUALITY_DESCRIPTIONS.get(self.current_quality, "")
 
     def _clear_all(self, e):
         """Clear all selections and reset UI"""
         self.selected_files.clear()
+        self._file_sizes.clear()
+        self._file_rows.clear()
         self.results_panel.visible = False
         self.progress_container.visible = False
-        self._update_file_list()
-        self._update_buttons()
+        with self._batch():
+            self._update_file_list()
+            self._update_buttons()
+            self._update_controls(self.results_panel, self.progress_container)
 
     def _start_compression(self, e):
         """Start PDF compression process"""
@@ -820,14 +1195,45 @@ class MainWindow(ft.Column):
             return
 
         self.is_processing = True
-        self.results_panel.visible = False
-        self._show_progress("Iniciando compresión...")
-        self._update_buttons()
+        with self._batch():
+            if self.results_panel.visible:
+                self.results_panel.visible = False
+                self._update_controls(self.results_panel)
+            self._show_progress("Iniciando compresión...")
+            self._update_buttons()
 
-        # Start compression in background thread
-        threading.Thread(target=self._compress_files, daemon=True).start()
+        # The worker only sees this snapshot, so edits made while it runs
+        # (quality, removed files, a new Ghostscript path) cannot leak in
+        job = CompressionJob(
+            files=tuple(self.selected_files),
+            sizes=tuple(self._file_sizes[path] for path in self.selected_files),
+            quality=self.current_quality,
+            gs_path=self.gs_path,
+            output_dir=self.output_dir
+        )
 
-    def _compress_files(self):
+        # Run compression on the background worker
+        self._submit_job(lambda: self._compress_files(job))
+
+    def _submit_job(self, job: Callable[[], None]):
+        """Queue a job for the background worker, starting it if needed"""
+        if self._worker_thread is None:
+            self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
+            self._worker_thread.start()
+        self._job_queue.put(job)
+
+    def _worker_loop(self):
+        """Run queued jobs until a None sentinel arrives"""
+        while True:
+            job = self._job_queue.get()
+            if job is None:
+                break
+            try:
+                job()
+            except Exception as e:
+                logger.error("Error en tarea en segundo plano: %s", e)
+
+    def _compress_files(self, job: CompressionJob):
         """Compress files in background thread"""
         try:
             start_time = time.time()
@@ -836,39 +1242,77 @@ class MainWindow(ft.Column):
             successful_files = []
             failed_files = []
 
-            for i, file_path in enumerate(self.selected_files):
-                try:
-                    # Update progress
-                    self.page.run_thread(lambda: self._update_batch_progress(
-                        f"Comprimiendo: {file_path.name}",
-                        i + 1,
-                        len(self.selected_files)
-                    ))
-
-                    # Get original size
-                    original_size = file_path.stat().st_size
-                    total_original_size += original_size
-
-                    # Compress file
-                    output_path = self._compress_single_file(file_path)
-
-                    if output_path and output_path.exists():
-                        compressed_size = output_path.stat().st_size
-                        total_compressed_size += compressed_size
-                        successful_files.append({
-                            'original': file_path,
-                            'compressed': output_path,
-                            'original_size': original_size,
-                            'compressed_size': compressed_size
-                        })
-                        print(f"✅ Comprimido: {file_path.name} ({original_size/1024/1024:.1f}MB → {compressed_size/1024/1024:.1f}MB)")
-                    else:
-                        failed_files.append(file_path)
-                        print(f"❌ Falló: {file_path.name}")
+            # The batch as parallel columns, so the result loop reads names
+            # and sizes by index instead of touching the filesystem
+            files = job.files
+            names = [path.name for path in files]
+            sizes = job.sizes
+            total = len(files)
+
+            # Output names are claimed up front so parallel jobs never collide
+            claimed = set()
+            outputs = [self._output_path_for(path, job.output_dir, claimed) for path in files]
+
+            # Each job is a separate Ghostscript process on the shared pool.
+            # Largest files go first so small ones fill idle workers at the
+            # end instead of one big file running alone
+            executor = self._get_compress_pool()
+            largest_first = sorted(range(total), key=lambda i: sizes[i], reverse=True)
+            futures = {
+                executor.submit(self._compress_single_file, files[i], outputs[i], job): i
+                for i in largest_first
+            }
+            self._compress_futures = list(futures)
+            run_on_ui(
+                self.page, self._update_batch_progress,
+                f"Comprimiendo {total} archivo(s) en paralelo...", 0, total
+            )
+
+            # Completions only overwrite the latest progress; a pump on the
+            # event loop shows it at most once per frame, so bursts collapse
+            progress = LatestValue()
+            stop_pump = threading.Event()
+            pump = self.page.run_task(self._pump_batch_progress, progress, stop_pump, total)
 
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    i = futures[future]
+                    file_path = files[i]
+                    progress.publish((done, names[i]))
+                    try:
+                        # Size cached when the file was selected
+                        original_size = sizes[i]
+                        total_original_size += original_size
+
+                        output_path = future.result()
+
+                        if output_path and output_path.exists():
+                            compressed_size = output_path.stat().st_size
+                            total_compressed_size += compressed_size
+                            successful_files.append({
+                                'original': file_path,
+                                'compressed': output_path,
+                                'original_size': original_size,
+                                'compressed_size': compressed_size
+                            })
+                            logger.debug(
+                                "Comprimido: %s (%.1fMB → %.1fMB)", names[i],
+                                original_size / 1024 / 1024, compressed_size / 1024 / 1024
+                            )
+                        else:
+                            failed_files.append(file_path)
+                            logger.warning("Falló: %s", names[i])
+
+                    except Exception as e:
+                        logger.error("Error comprimiendo %s: %s", file_path, e)
+                        failed_files.append(file_path)
+            finally:
+                # Let the pump show the final count before results replace it
+                stop_pump.set()
+                try:
+                    pump.result(timeout=1)
                 except Exception as e:
-                    print(f"Error comprimiendo {file_path}: {e}")
-                    failed_files.append(file_path)
+                    logger.debug("Progreso no finalizado: %s", e)
 
             # Calculate statistics
             processing_time = time.time() - start_time
@@ -879,13 +1323,14 @@ class MainWindow(ft.Column):
             self.processing_stats = {
                 'successful_files': successful_files,
                 'failed_files': failed_files,
-                'total_files': len(self.selected_files),
+                'total_files': total,
                 'successful_count': len(successful_files),
                 'failed_count': len(failed_files),
                 'original_size': total_original_size,
                 'compressed_size': total_compressed_size,
                 'compression_ratio': compression_ratio,
                 'space_saved': total_original_size - total_compressed_size,
+                'quality': job.quality,
                 'processing_time': processing_time
             }
 
@@ -893,66 +1338,48 @@ class MainWindow(ft.Column):
             self._add_to_history()
 
             # Show results
-            self.page.run_thread(self._show_results)
+            run_on_ui(self.page, self._show_results)
 
         except Exception as e:
-            print(f"Error durante la compresión: {e}")
-            self.page.run_thread(lambda: self._show_error(f"Error durante la compresión: {str(e)}"))
+            logger.error("Error durante la compresión: %s", e)
+            run_on_ui(self.page, self._show_error, f"Error durante la compresión: {str(e)}")
         finally:
             self.is_processing = False
-            self.page.run_thread(self._hide_progress)
-            self.page.run_thread(self._update_buttons)
+            run_on_ui(self.page, self._finish_processing)
+
+    def _get_compress_pool(self) -> ThreadPoolExecutor:
+        """Get the compression pool, creating it with one worker per core"""
+        if self._compress_pool is None:
+            self._compress_pool = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                thread_name_prefix="gs-compress"
+            )
+        return self._compress_pool
+
+    def _output_path_for(self, input_path: Path, output_dir: Path, claimed: set) -> Path:
+        """Pick an unused output path for input_path and add it to claimed"""
+        output_path = output_dir / f"{input_path.stem}_compressed.pdf"
+
+        # Ensure unique filename, also among paths claimed by this batch
+        counter = 1
+        while output_path in claimed or output_path.exists():
+            output_path = output_dir / f"{input_path.stem}_compressed_{counter}.pdf"
+            counter += 1
 
-    def _compress_single_file(self, input_path: Path) -> Optional[Path]:
+        claimed.add(output_path)
+        return output_path
+
+    def _compress_single_file(self, input_path: Path, output_path: Path, job: CompressionJob) -> Optional[Path]:
         """Compress a single PDF file using Ghostscript with advanced settings"""
         try:
-            # Generate output filename
-            output_filename = f"{input_path.stem}_compressed.pdf"
-            output_path = self.output_dir / output_filename
-
-            # Ensure unique filename
-            counter = 1
-            while output_path.exists():
-                output_filename = f"{input_path.stem}_compressed_{counter}.pdf"
-                output_path = self.output_dir / output_filename
-                counter += 1
-
-            # Enhanced quality settings for Ghostscript
-            quality_settings = {
-                "high": {
-                    "dPDFSETTINGS": "/printer",
-                    "dColorImageResolution": "150",
-                    "dGrayImageResolution": "150",
-                    "dMonoImageResolution": "300",
-                    "dColorImageDownsampleType": "/Bicubic"
-                },
-                "medium": {
-                    "dPDFSETTINGS": "/ebook",
-                    "dColorImageResolution": "72",
-                    "dGrayImageResolution": "72",
-                    "dMonoImageResolution": "150",
-                    "dColorImageDownsampleType": "/Average"
-                },
-                "low": {
-                    "dPDFSETTINGS": "/screen",
-                    "dColorImageResolution": "36",
-                    "dGrayImageResolution": "36",
-                    "dMonoImageResolution": "72",
-                    "dColorImageDownsampleType": "/Subsample"
-                }
-            }
-
-            settings = quality_settings.get(self.current_quality, quality_settings["medium"])
+            settings = COMPRESSION_QUALITY_SETTINGS.get(
+                job.quality, COMPRESSION_QUALITY_SETTINGS["medium"]
+            )
 
-            # Build simplified and reliable Ghostscript command
             cmd = [
-                self.gs_path,
+                job.gs_path,
                 "-sDEVICE=pdfwrite",
                 "-dCompatibilityLevel=1.4",
-                "-dNOPAUSE",
-                "-dQUIET",
-                "-dBATCH",
-                "-dSAFER",
                 f"-dPDFSETTINGS={settings['dPDFSETTINGS']}",
                 f"-dColorImageResolution={settings['dColorImageResolution']}",
                 f"-dGrayImageResolution={settings['dGrayImageResolution']}",
@@ -960,34 +1387,41 @@ class MainWindow(ft.Column):
                 "-dCompressFonts=true",
                 "-dSubsetFonts=true",
                 "-dEmbedAllFonts=true",
+                "-dNOPAUSE",
+                "-dQUIET",
+                "-dBATCH",
+                "-dSAFER",
                 f"-sOutputFile={output_path}",
                 str(input_path)
             ]
 
-            # Execute Ghostscript
-            print(f"🔄 Ejecutando compresión: {input_path.name}")
-            print(f"   Configuración: {self.current_quality} | Preset: {settings['dPDFSETTINGS']}")
+            logger.debug(
+                "Ejecutando compresión: %s | Configuración: %s | Preset: %s",
+                input_path.name, job.quality, settings['dPDFSETTINGS']
+            )
 
+            # Only stderr is reported; stdout is silent under -dQUIET
             result = subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=300,  # 5 minute timeout
-                cwd=str(self.output_dir)
+                cwd=str(job.output_dir)
             )
 
             if result.returncode == 0 and output_path.exists():
-                print(f"✅ Compresión exitosa: {output_path.name}")
+                logger.debug("Compresión exitosa: %s", output_path.name)
                 return output_path
             else:
-                print(f"❌ Ghostscript error: {result.stderr}")
+                logger.error("Ghostscript error: %s", result.stderr)
                 return None
 
         except subprocess.TimeoutExpired:
-            print(f"❌ Timeout comprimiendo {input_path.name}")
+            logger.error("Timeout comprimiendo %s", input_path.name)
             return None
         except Exception as e:
-            print(f"❌ Error comprimiendo {input_path.name}: {e}")
+            logger.error("Error comprimiendo %s: %s", input_path.name, e)
             return None
 
     # Progress and UI update methods
@@ -1001,7 +1435,7 @@ class MainWindow(ft.Column):
         progress_text.value = message
         progress_bar.visible = True
         progress_container.visible = True
-        self.update()
+        self._update_controls(self.progress_container)
 
     def _update_batch_progress(self, message, current, total):
         """Update batch progress with current file information"""
@@ -1016,12 +1450,34 @@ class MainWindow(ft.Column):
         batch_ring.visible = True
         batch_info.value = f"Procesando archivo {current} de {total}"
         batch_container.visible = True
-        self.update()
+        self._update_controls(self.progress_container)
+
+    async def _pump_batch_progress(self, progress: LatestValue, stop: threading.Event, total: int):
+        """Show the latest batch progress at most once per frame until stopped"""
+        while True:
+            # Checked before reading so the last value published before the
+            # stop is still shown
+            stopping = stop.is_set()
+            latest = progress.take()
+            if latest is not None:
+                done, name = latest
+                self._update_batch_progress(f"Completado: {name}", done, total)
+            if stopping:
+                return
+            await asyncio.sleep(FRAME_INTERVAL)
 
     def _hide_progress(self):
         """Hide progress indicators"""
+        if not self.progress_container.visible:
+            return
+        self.progress_container.visible = False
+        self._update_controls(self.progress_container)
+
+    def _finish_processing(self):
+        """Hide progress and re-enable the buttons, sending only those controls"""
         self.progress_container.visible = False
-        self.update()
+        self._set_button_states()
+        self._update_controls(self.progress_container, self.process_button, self.clear_button)
 
     def _show_results(self):
         """Show compression results with improved dark mode support"""
@@ -1075,7 +1531,7 @@ class MainWindow(ft.Column):
                 # Additional stats with better visibility
                 ft.Row([
                     ft.Text("Configuración utilizada:", weight=ft.FontWeight.W_500, size=13, color=primary_text_color),
-                    ft.Text(f"Calidad {self.current_quality.title()}", color=accent_color, size=12)
+                    ft.Text(f"Calidad {stats['quality'].title()}", color=accent_color, size=12)
                 ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
 
                 ft.Row([
@@ -1098,45 +1554,52 @@ class MainWindow(ft.Column):
 
         # Update results panel background for dark mode
         self.results_panel.bgcolor = "#1f2937" if self.is_dark_mode else "#ecfdf5"
-        self.results_panel.border = ft.border.all(1, "#374151" if self.is_dark_mode else "#a7f3d0")
+        self.results_panel.border = _border_all("#374151" if self.is_dark_mode else "#a7f3d0")
 
         self.results_panel.visible = True
-        self.update()
+        self._update_controls(self.results_panel)
+
+    def _show_snack(self, message: str, bgcolor: str, text_color: Optional[str] = None, duration: int = 4000):
+        """Show a notification in the shared snack bar"""
+        self._snack_text.value = message
+        self._snack_text.color = text_color
+        self._snack_bar.bgcolor = bgcolor
+        self._snack_bar.duration = duration
+        self._snack_bar.open = True
+        self.page.update()
 
     def _show_error(self, message):
         """Show error message"""
-        snack_bar = ft.SnackBar(
-            content=ft.Text(message, color="white"),
-            bgcolor="#dc2626",
-            duration=5000
-        )
-        self.page.overlay.append(snack_bar)
-        snack_bar.open = True
-        self.page.update()
+        self._show_snack(message, "#dc2626", text_color="white", duration=5000)
 
     # Result panel actions
-    def _open_result_file(self, e):
-        """Open the first compressed file"""
+    @staticmethod
+    def _open_with_system(path: Path, folder: bool = False):
+        """Open a file or folder with the platform's default handler (blocking)"""
+        if os.name == 'nt':  # Windows
+            if folder:
+                subprocess.run(['explorer', str(path)])
+            else:
+                os.startfile(str(path))
+        elif os.name == 'posix':  # macOS and Linux
+            subprocess.run(['open' if sys.platform == 'darwin' else 'xdg-open', str(path)])
+
+    async def _open_result_file(self, e):
+        """Open the first compressed file without blocking the event loop"""
         if self.processing_stats.get('successful_files'):
             file_info = self.processing_stats['successful_files'][0]
             output_path = file_info['compressed']
             try:
-                if os.name == 'nt':  # Windows
-                    os.startfile(str(output_path))
-                elif os.name == 'posix':  # macOS and Linux
-                    subprocess.run(['open' if sys.platform == 'darwin' else 'xdg-open', str(output_path)])
-                print(f"📂 Abriendo archivo: {output_path}")
+                await run_blocking(self._open_with_system, output_path)
+                logger.debug("Abriendo archivo: %s", output_path)
             except Exception as e:
                 self._show_error(f"No se pudo abrir el archivo: {e}")
 
-    def _show_in_folder(self, e):
-        """Show output folder in file explorer"""
+    async def _show_in_folder(self, e):
+        """Show output folder in file explorer without blocking the event loop"""
         try:
-            if os.name == 'nt':  # Windows
-                subprocess.run(['explorer', str(self.output_dir)])
-            elif os.name == 'posix':  # macOS and Linux
-                subprocess.run(['open' if sys.platform == 'darwin' else 'xdg-open', str(self.output_dir)])
-            print(f"📂 Abriendo carpeta: {self.output_dir}")
+            await run_blocking(self._open_with_system, self.output_dir, True)
+            logger.debug("Abriendo carpeta: %s", self.output_dir)
         except Exception as e:
             self._show_error(f"No se pudo abrir la carpeta: {e}")
 
@@ -1147,7 +1610,19 @@ class MainWindow(ft.Column):
     def cleanup(self):
         """Cleanup resources"""
         self.is_processing = False
-        print("🧹 Limpieza de recursos completada")
+        if self._worker_thread is not None:
+            # Let the worker finish its current job and exit
+            self._job_queue.put(None)
+            self._worker_thread = None
+        if self._compress_pool is not None:
+            # shutdown(cancel_futures=True) needs Python 3.9, so files not
+            # started yet are cancelled one by one
+            for future in self._compress_futures:
+                future.cancel()
+            self._compress_futures = []
+            self._compress_pool.shutdown(wait=False)
+            self._compress_pool = None
+        logger.debug("Limpieza de recursos completada")
 
     # Theme and UI methods
     def _get_icon_color(self):
@@ -1175,7 +1650,6 @@ class MainWindow(ft.Column):
 
         # Update page theme
         self.page.theme_mode = ft.ThemeMode.DARK if self.is_dark_mode else ft.ThemeMode.LIGHT
-        self.page.update()
 
         # Update tabbed interface theme
         if self.tabbed_interface:
@@ -1189,12 +1663,12 @@ class MainWindow(ft.Column):
         if self.pdf_merger:
             self.pdf_merger.theme = self.theme
 
-        # Rebuild the interface with new theme
-        self.controls.clear()
-        self.controls.extend(self._build_layout())
-        self.update()
+        # Patch colors on the existing controls instead of rebuilding the layout
+        self._apply_theme_to_controls()
+        self._recolor_file_rows()
+        self.page.update()
 
-        print(f"🎨 Tema cambiado a: {'Oscuro' if self.is_dark_mode else 'Claro'}")
+        logger.debug("Tema cambiado a: %s", "Oscuro" if self.is_dark_mode else "Claro")
 
     def _show_history(self, e):
         """Show operation history dialog with improved centering"""
@@ -1224,7 +1698,7 @@ class MainWindow(ft.Column):
                             style=ft.ButtonStyle(
                                 bgcolor="#f59e0b",
                                 color="white",
-                                padding=ft.padding.symmetric(horizontal=16, vertical=8)
+                                padding=DIALOG_BUTTON_PADDING
                             )
                         ),
                         ft.ElevatedButton(
@@ -1234,7 +1708,7 @@ class MainWindow(ft.Column):
                             style=ft.ButtonStyle(
                                 bgcolor="#2563eb",
                                 color="white",
-                                padding=ft.padding.symmetric(horizontal=16, vertical=8)
+                                padding=DIALOG_BUTTON_PADDING
                             )
                         )
                     ], spacing=12, alignment=ft.MainAxisAlignment.CENTER)
@@ -1286,6 +1760,11 @@ class MainWindow(ft.Column):
                 height=250
             )
 
+        # Theme colors resolved once for every entry
+        secondary_color = self._get_secondary_text_color()
+        item_bgcolor = self._get_input_bg_color()
+        border = _border_all(self._get_border_color())
+
         history_items = []
         for i, operation in enumerate(reversed(self.operation_history[-10:])):  # Show last 10
             history_items.append(
@@ -1296,10 +1775,10 @@ class MainWindow(ft.Column):
                                 content=ft.Text(f"#{len(self.operation_history) - i}", size=11, color="#ffffff", weight=ft.FontWeight.BOLD),
                                 bgcolor="#2563eb",
                                 border_radius=12,
-                                padding=ft.padding.symmetric(horizontal=8, vertical=2),
+                                padding=BADGE_PADDING,
                                 width=35
                             ),
-                            ft.Text(operation.get('timestamp', 'N/A'), size=12, color=self._get_secondary_text_color()),
+                            ft.Text(operation.get('timestamp', 'N/A'), size=12, color=secondary_color),
                             ft.Container(
                                 content=ft.Text(f"{operation.get('files_count', 0)} archivos", size=11, color="#ffffff", weight=ft.FontWeight.W_500),
                                 bgcolor="#059669",
@@ -1324,10 +1803,10 @@ class MainWindow(ft.Column):
                         ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
                     ], spacing=2),
                     padding=12,
-                    bgcolor=self._get_input_bg_color(),
+                    bgcolor=item_bgcolor,
                     border_radius=8,
-                    border=ft.border.all(1, self._get_border_color()),
-                    margin=ft.margin.only(bottom=6)
+                    border=border,
+                    margin=HISTORY_ITEM_MARGIN
                 )
             )
 
@@ -1335,17 +1814,14 @@ class MainWindow(ft.Column):
             content=ft.Column(history_items, spacing=4, scroll=ft.ScrollMode.AUTO),
             height=250,
             border_radius=8,
-            border=ft.border.all(1, self._get_border_color()),
+            border=border,
             padding=8
         )
 
     def _clear_history(self, e):
         """Clear operation history"""
         self.operation_history.clear()
-        snack_bar = ft.SnackBar(content=ft.Text("Historial limpiado"), bgcolor="#059669")
-        self.page.overlay.append(snack_bar)
-        snack_bar.open = True
-        self.page.update()
+        self._show_snack("Historial limpiado", "#059669")
 
     def _export_history(self, e):
         """Export history to file"""
@@ -1358,15 +1834,20 @@ class MainWindow(ft.Column):
             with open(export_file, 'w', encoding='utf-8') as f:
                 json.dump(self.operation_history, f, indent=2, ensure_ascii=False)
 
-            snack_bar = ft.SnackBar(content=ft.Text(f"Historial exportado: {export_file.name}"), bgcolor="#059669")
-            self.page.overlay.append(snack_bar)
-            snack_bar.open = True
-            self.page.update()
+            self._show_snack(f"Historial exportado: {export_file.name}", "#059669")
         except Exception as ex:
             self._show_error(f"Error exportando historial: {ex}")
 
     def _show_help(self, e):
         """Show help dialog with comprehensive information"""
+        # The help content is static, so one dialog per theme is built and reopened
+        key = ("help", self.is_dark_mode)
+        help_dialog = self._dialog_cache.get(key)
+        if help_dialog is not None:
+            help_dialog.open = True
+            self.page.update()
+            return
+
         help_dialog = ft.AlertDialog(
             modal=True,
             title=ft.Row([
@@ -1411,6 +1892,7 @@ class MainWindow(ft.Column):
                 ft.TextButton("Cerrar", on_click=lambda _: self._close_dialog(help_dialog))
             ]
         )
+        self._dialog_cache[key] = help_dialog
         self.page.overlay.append(help_dialog)
         help_dialog.open = True
         self.page.update()
@@ -1418,6 +1900,22 @@ class MainWindow(ft.Column):
     def _show_settings(self, e):
         """Show compact settings dialog with advanced Ghostscript options"""
 
+        # Only the visible tab is built up front; the others are built the
+        # first time they are selected
+        tab_builders = [
+            self._create_general_settings_tab,
+            self._create_ghostscript_settings_tab,
+            self._create_advanced_settings_tab
+        ]
+        built_tabs = [True, False, False]
+
+        def materialize_tab(e):
+            index = e.control.selected_index
+            if not built_tabs[index]:
+                built_tabs[index] = True
+                e.control.tabs[index].content = tab_builders[index]()
+                self.page.update()
+
         # Create tabs for better organization
         settings_tabs = ft.Tabs(
             selected_index=0,
@@ -1426,20 +1924,21 @@ class MainWindow(ft.Column):
                 ft.Tab(
                     text="General",
                     icon=ft.Icons.SETTINGS,
-                    content=self._create_general_settings_tab()
+                    content=tab_builders[0]()
                 ),
                 ft.Tab(
                     text="Ghostscript",
                     icon=ft.Icons.TUNE,
-                    content=self._create_ghostscript_settings_tab()
+                    content=ft.Container()
                 ),
                 ft.Tab(
                     text="Avanzado",
                     icon=ft.Icons.ENGINEERING,
-                    content=self._create_advanced_settings_tab()
+                    content=ft.Container()
                 )
             ],
-            height=350
+            height=350,
+            on_change=materialize_tab
         )
 
         settings_dialog = ft.AlertDialog(
@@ -1515,7 +2014,7 @@ class MainWindow(ft.Column):
                         style=ft.ButtonStyle(
                             bgcolor="#2563eb",
                             color="white",
-                            padding=ft.padding.symmetric(horizontal=12, vertical=6)
+                            padding=SMALL_BUTTON_PADDING
                         ),
                         height=32
                     )
@@ -1548,7 +2047,7 @@ class MainWindow(ft.Column):
                         style=ft.ButtonStyle(
                             bgcolor="#059669",
                             color="white",
-                            padding=ft.padding.symmetric(horizontal=12, vertical=6)
+                            padding=SMALL_BUTTON_PADDING
                         ),
                         height=32
                     )
@@ -1600,7 +2099,8 @@ class MainWindow(ft.Column):
                         ],
                         width=200,
                         text_size=11,
-                        on_change=lambda e: self._update_gs_setting('color_conversion', e.control.value)
+                        data='color_conversion',
+                        on_change=self._on_gs_setting_changed
                     )
                 ], spacing=6),
 
@@ -1622,7 +2122,8 @@ class MainWindow(ft.Column):
                         ],
                         width=200,
                         text_size=11,
-                        on_change=lambda e: self._update_gs_setting('image_compression', e.control.value)
+                        data='image_compression',
+                        on_change=self._on_gs_setting_changed
                     )
                 ], spacing=6),
 
@@ -1644,7 +2145,8 @@ class MainWindow(ft.Column):
                         ],
                         width=200,
                         text_size=11,
-                        on_change=lambda e: self._update_gs_setting('optimize_for', e.control.value)
+                        data='optimize_for',
+                        on_change=self._on_gs_setting_changed
                     )
                 ], spacing=6)
             ], spacing=10, scroll=ft.ScrollMode.AUTO),
@@ -1665,13 +2167,15 @@ class MainWindow(ft.Column):
                     ft.Checkbox(
                         label="Incrustar fuentes",
                         value=self.gs_advanced_settings['font_embedding'],
-                        on_change=lambda e: self._update_gs_setting('font_embedding', e.control.value),
+                        data='font_embedding',
+                        on_change=self._on_gs_setting_changed,
                         scale=0.8
                     ),
                     ft.Checkbox(
                         label="Submuestrear imágenes",
                         value=self.gs_advanced_settings['downsample_images'],
-                        on_change=lambda e: self._update_gs_setting('downsample_images', e.control.value),
+                        data='downsample_images',
+                        on_change=self._on_gs_setting_changed,
                         scale=0.8
                     )
                 ], spacing=20),
@@ -1679,7 +2183,8 @@ class MainWindow(ft.Column):
                 ft.Checkbox(
                     label="Preservar transparencia",
                     value=self.gs_advanced_settings['preserve_transparency'],
-                    on_change=lambda e: self._update_gs_setting('preserve_transparency', e.control.value),
+                    data='preserve_transparency',
+                    on_change=self._on_gs_setting_changed,
                     scale=0.8
                 ),
 
@@ -1746,24 +2251,20 @@ class MainWindow(ft.Column):
     def _update_gs_setting(self, key, value):
         """Update Ghostscript advanced setting"""
         self.gs_advanced_settings[key] = value
-        print(f"🔧 Configuración actualizada: {key} = {value}")
+        logger.debug("Configuración actualizada: %s = %s", key, value)
+
+    def _on_gs_setting_changed(self, e):
+        """Shared change handler; each control stores its setting key in data"""
+        self._update_gs_setting(e.control.data, e.control.value)
 
     def _reset_settings(self, e):
         """Reset all settings to defaults"""
-        self.gs_advanced_settings = {
-            'color_conversion': 'RGB',
-            'image_compression': 'JPEG',
-            'font_embedding': True,
-            'optimize_for': 'web',
-            'preserve_transparency': True,
-            'downsample_images': True
-        }
+        self.gs_advanced_settings = dict(DEFAULT_GS_ADVANCED_SETTINGS)
         self.current_quality = "medium"
-        snack_bar = ft.SnackBar(content=ft.Text("Configuración restablecida"), bgcolor="#059669")
-        self.page.overlay.append(snack_bar)
-        snack_bar.open = True
-        self.page.update()
-        self.update()
+        self.quality_dropdown.value = self.current_quality
+        self.quality_description.value = self._get_quality_description()
+        # The snack bar's page.update() also sends the dropdown and description
+        self._show_snack("Configuración restablecida", "#059669")
 
     def _get_secondary_text_color(self):
         """Get secondary text color based on theme"""
@@ -1776,25 +2277,21 @@ class MainWindow(ft.Column):
     def _change_output_dir(self, e):
         """Change output directory"""
         # This would typically open a directory picker
-        snack_bar = ft.SnackBar(content=ft.Text("Función de cambio de directorio en desarrollo"), bgcolor="#f59e0b")
-        self.page.overlay.append(snack_bar)
-        snack_bar.open = True
-        self.page.update()
+        self._show_snack("Función de cambio de directorio en desarrollo", "#f59e0b")
 
-    def _detect_ghostscript_manual(self, e):
-        """Manually detect Ghostscript"""
-        old_path = self.gs_path
-        self.gs_path = self._detect_ghostscript()
+    async def _detect_ghostscript_manual(self, e):
+        """Manually detect Ghostscript, probing off the event loop"""
+        self.gs_path = await run_blocking(self._detect_ghostscript)
+        # Also settles the status if startup detection is still running
+        self._gs_detecting = False
 
-        if self.gs_path != old_path:
+        with self._batch():
+            self._refresh_gs_status()
             self._update_buttons()
-            snack_bar = ft.SnackBar(
-                content=ft.Text("Ghostscript detectado correctamente" if self.gs_path else "Ghostscript no encontrado"),
-                bgcolor="#059669" if self.gs_path else "#dc2626"
-            )
-            self.page.overlay.append(snack_bar)
-            snack_bar.open = True
-            self.page.update()
+        self._show_snack(
+            "Ghostscript detectado correctamente" if self.gs_path else "Ghostscript no encontrado",
+            "#059669" if self.gs_path else "#dc2626"
+        )
 
     def _close_dialog(self, dialog):
         """Close dialog"""
@@ -1803,13 +2300,7 @@ class MainWindow(ft.Column):
 
     def _load_demo_files(self, e):
         """Load demo files for testing"""
-        snack_bar = ft.SnackBar(
-            content=ft.Text("Función demo: Selecciona archivos PDF reales para probar la compresión"),
-            bgcolor="#2563eb"
-        )
-        self.page.overlay.append(snack_bar)
-        snack_bar.open = True
-        self.page.update()
+        self._show_snack("Función demo: Selecciona archivos PDF reales para probar la compresión", "#2563eb")
 
     def _add_to_history(self):
         """Add current operation to history"""
@@ -1822,7 +2313,7 @@ class MainWindow(ft.Column):
                 'compression_ratio': self.processing_stats.get('compression_ratio', 0),
                 'space_saved': self.processing_stats.get('space_saved', 0),
                 'processing_time': self.processing_stats.get('processing_time', 0),
-                'quality': self.current_quality,
+                'quality': self.processing_stats.get('quality', self.current_quality),
                 'original_size': self.processing_stats.get('original_size', 0),
                 'compressed_size': self.processing_stats.get('compressed_size', 0)
             }
@@ -1833,7 +2324,10 @@ class MainWindow(ft.Column):
             if len(self.operation_history) > 50:
                 self.operation_history = self.operation_history[-50:]
 
-            print(f"📝 Operación añadida al historial: {history_entry['files_count']} archivos, {history_entry['compression_ratio']:.1f}% compresión")
+            logger.debug(
+                "Operación añadida al historial: %d archivos, %.1f%% compresión",
+                history_entry['files_count'], history_entry['compression_ratio']
+            )
 
     def _setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts"""
@@ -1850,4 +2344,4 @@ class MainWindow(ft.Column):
                 self._show_history(None)
 
         self.page.on_keyboard_event = on_keyboard
-        print("⌨️ Atajos de teclado configurados")
+        logger.debug("Atajos de teclado configurados")
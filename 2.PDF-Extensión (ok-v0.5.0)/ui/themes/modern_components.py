@@ -4,54 +4,125 @@ Creates consistent, modern UI elements without shadows (per user preference)
 """
 
 import flet as ft
-from typing import Optional, List, Callable, Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, List, Callable, Dict, Any, Tuple
 
-def create_modern_button(
-    text: str,
-    icon: Optional[str] = None,
-    on_click: Optional[Callable] = None,
-    style: str = "primary",
-    theme: Dict[str, str] = None,
-    disabled: bool = False,
-    width: Optional[float] = None,
-    height: float = 45
-) -> ft.Container:
-    """Create modern button without shadows"""
+# Default light theme colors used when no theme is passed, built once
+_DEFAULT_BUTTON_THEME = MappingProxyType({
+    'button_primary_bg': '#2563eb',
+    'button_primary_hover': '#1d4ed8',
+    'button_secondary_bg': '#f1f5f9',
+    'button_secondary_hover': '#e2e8f0',
+    'on_primary': '#ffffff',
+    'on_surface': '#0f172a',
+    'primary': '#2563eb',
+    'surface_variant': '#f1f5f9',
+    'border': '#e2e8f0'
+})
+
+_DEFAULT_CARD_THEME = MappingProxyType({
+    'surface': '#ffffff',
+    'border': '#e2e8f0'
+})
+
+_DEFAULT_INPUT_THEME = MappingProxyType({
+    'input_bg': '#ffffff',
+    'input_border': '#d1d5db',
+    'input_focused_border': '#2563eb',
+    'on_surface_variant': '#64748b',
+    'on_surface': '#0f172a'
+})
+
+_DEFAULT_STATUS_CHIP_THEME = MappingProxyType({
+    'info': '#3b82f6',
+    'success': '#059669',
+    'warning': '#f59e0b',
+    'error': '#dc2626',
+    'on_primary': '#ffffff'
+})
+
+_DEFAULT_PROGRESS_THEME = MappingProxyType({
+    'primary': '#2563eb',
+    'on_surface': '#0f172a',
+    'surface': '#ffffff'
+})
+
+_DEFAULT_FILE_INFO_THEME = MappingProxyType({
+    'surface': '#ffffff',
+    'border': '#e2e8f0',
+    'on_surface': '#0f172a',
+    'on_surface_variant': '#64748b'
+})
+
+# Statuses with a matching color in every theme
+_STATUS_KEYS = frozenset(('info', 'success', 'warning', 'error'))
+
+# Theme-independent animations shared by every component
+_ANIMATION_FAST = ft.Animation(150, ft.AnimationCurve.EASE_OUT)
+_ANIMATION_CARD = ft.Animation(200, ft.AnimationCurve.EASE_OUT)
+
+@lru_cache(maxsize=16)
+def _padding_symmetric(horizontal: int, vertical: int) -> ft.Padding:
+    """Get a shared symmetric padding; components only read it"""
+    return ft.padding.symmetric(horizontal=horizontal, vertical=vertical)
+
+@lru_cache(maxsize=16)
+def _padding_all(value: int) -> ft.Padding:
+    """Get a shared uniform padding"""
+    return ft.padding.all(value)
+
+@lru_cache(maxsize=32)
+def _text_style(color: str, size: int, weight: Optional[ft.FontWeight] = None) -> ft.TextStyle:
+    """Get a shared text style for input and dropdown labels and values"""
+    return ft.TextStyle(color=color, size=size, weight=weight)
+
+@lru_cache(maxsize=64)
+def _border_all(width: int, color: str) -> ft.Border:
+    """Get a shared uniform border for a theme color"""
+    return ft.border.all(width, color)
+
+# Resolved button colors keyed by (style, id(theme), disabled); the theme is
+# kept alongside so a recycled id can never return stale colors
+_BUTTON_STYLE_CACHE: Dict[tuple, tuple] = {}
+
+def _resolve_button_style(
+    style: str,
+    theme: Dict[str, str],
+    disabled: bool
+) -> Tuple[str, str, Optional[str]]:
+    """
+    Resolve button colors for a style, memoized per theme
     
-    if theme is None:
-        # Default light theme colors
-        theme = {
-            'button_primary_bg': '#2563eb',
-            'button_primary_hover': '#1d4ed8',
-            'button_secondary_bg': '#f1f5f9',
-            'button_secondary_hover': '#e2e8f0',
-            'on_primary': '#ffffff',
-            'on_surface': '#0f172a',
-            'primary': '#2563eb',
-            'surface_variant': '#f1f5f9',
-            'border': '#e2e8f0'
-        }
+    Args:
+        style: Button style (primary, secondary, accent, outline)
+        theme: Theme colors
+        disabled: Whether the button is disabled
+        
+    Returns:
+        Tuple of (background color, text color, border color)
+    """
+    key = (style, id(theme), disabled)
+    cached = _BUTTON_STYLE_CACHE.get(key)
+    if cached is not None and cached[0] is theme:
+        return cached[1]
     
     # Configure style colors
     if style == "primary":
         bg_color = theme['button_primary_bg']
         text_color = theme['on_primary']
-        hover_color = theme['button_primary_hover']
         border_color = None
     elif style == "secondary":
         bg_color = theme['button_secondary_bg']
         text_color = theme['on_surface']
-        hover_color = theme['button_secondary_hover']
         border_color = theme['border']
     elif style == "accent":
         bg_color = theme.get('accent', theme['primary'])
         text_color = theme['on_primary']
-        hover_color = theme['button_primary_hover']
         border_color = None
     else:  # outline
         bg_color = "transparent"
         text_color = theme['primary']
-        hover_color = theme['surface_variant']
         border_color = theme['primary']
     
     # Handle disabled state
@@ -60,6 +131,24 @@ def create_modern_button(
         text_color = theme.get('on_surface_variant', theme['on_surface'])
         border_color = theme.get('border_variant', theme['border'])
     
+    colors = (bg_color, text_color, border_color)
+    _BUTTON_STYLE_CACHE[key] = (theme, colors)
+    return colors
+
+def create_modern_button(
+    text: str,
+    icon: Optional[str] = None,
+    on_click: Optional[Callable] = None,
+    style: str = "primary",
+    theme: Dict[str, str] = _DEFAULT_BUTTON_THEME,
+    disabled: bool = False,
+    width: Optional[float] = None,
+    height: float = 45
+) -> ft.Container:
+    """Create modern button without shadows"""
+    
+    bg_color, text_color, border_color = _resolve_button_style(style, theme, disabled)
+    
     # Create button content
     button_content = []
     
@@ -86,12 +175,12 @@ def create_modern_button(
             tight=True
         ),
         bgcolor=bg_color,
-        border=ft.border.all(1, border_color) if border_color else None,
+        border=_border_all(1, border_color) if border_color else None,
         border_radius=10,
-        padding=ft.padding.symmetric(horizontal=20, vertical=12),
+        padding=_padding_symmetric(20, 12),
         alignment=ft.alignment.center,
         on_click=on_click if not disabled else None,
-        animate=ft.Animation(150, ft.AnimationCurve.EASE_OUT),
+        animate=_ANIMATION_FAST,
         height=height,
         width=width,
         tooltip=text if len(text) > 15 else None
@@ -99,21 +188,15 @@ def create_modern_button(
 
 def create_modern_card(
     content: List[ft.Control],
-    theme: Dict[str, str] = None,
+    theme: Dict[str, str] = _DEFAULT_CARD_THEME,
     padding: ft.Padding = None,
     width: Optional[float] = None,
     height: Optional[float] = None
 ) -> ft.Container:
     """Create modern card without shadows"""
     
-    if theme is None:
-        theme = {
-            'surface': '#ffffff',
-            'border': '#e2e8f0'
-        }
-    
     if padding is None:
-        padding = ft.padding.all(20)
+        padding = _padding_all(20)
     
     return ft.Container(
         content=ft.Column(
@@ -124,10 +207,10 @@ def create_modern_card(
         bgcolor=theme['surface'],
         border_radius=12,
         padding=padding,
-        border=ft.border.all(1, theme['border']),
+        border=_border_all(1, theme['border']),
         width=width,
         height=height,
-        animate=ft.Animation(200, ft.AnimationCurve.EASE_OUT)
+        animate=_ANIMATION_CARD
     )
 
 def create_modern_input(
@@ -139,20 +222,11 @@ def create_modern_input(
     on_change: Optional[Callable] = None,
     multiline: bool = False,
     password: bool = False,
-    theme: Dict[str, str] = None,
+    theme: Dict[str, str] = _DEFAULT_INPUT_THEME,
     width: Optional[float] = None
 ) -> ft.TextField:
     """Create modern input field"""
     
-    if theme is None:
-        theme = {
-            'input_bg': '#ffffff',
-            'input_border': '#d1d5db',
-            'input_focused_border': '#2563eb',
-            'on_surface_variant': '#64748b',
-            'on_surface': '#0f172a'
-        }
-    
     return ft.TextField(
         label=label,
         value=value,
@@ -167,15 +241,9 @@ def create_modern_input(
         border_color=theme['input_border'],
         focused_border_color=theme['input_focused_border'],
         border_radius=8,
-        content_padding=ft.padding.symmetric(horizontal=16, vertical=12),
-        label_style=ft.TextStyle(
-            color=theme['on_surface_variant'],
-            size=14
-        ),
-        text_style=ft.TextStyle(
-            color=theme['on_surface'],
-            size=14
-        ),
+        content_padding=_padding_symmetric(16, 12),
+        label_style=_text_style(theme['on_surface_variant'], 14),
+        text_style=_text_style(theme['on_surface'], 14),
         width=width
     )
 
@@ -184,20 +252,11 @@ def create_modern_dropdown(
     options: List[ft.dropdown.Option],
     value: Optional[str] = None,
     on_change: Optional[Callable] = None,
-    theme: Dict[str, str] = None,
+    theme: Dict[str, str] = _DEFAULT_INPUT_THEME,
     width: Optional[float] = None
 ) -> ft.Dropdown:
     """Create modern dropdown"""
     
-    if theme is None:
-        theme = {
-            'input_bg': '#ffffff',
-            'input_border': '#d1d5db',
-            'input_focused_border': '#2563eb',
-            'on_surface_variant': '#64748b',
-            'on_surface': '#0f172a'
-        }
-    
     return ft.Dropdown(
         label=label,
         value=value,
@@ -208,45 +267,22 @@ def create_modern_dropdown(
         border_color=theme['input_border'],
         focused_border_color=theme['input_focused_border'],
         border_radius=8,
-        content_padding=ft.padding.symmetric(horizontal=16, vertical=8),
-        label_style=ft.TextStyle(
-            color=theme['on_surface_variant'],
-            size=14
-        ),
-        text_style=ft.TextStyle(
-            color=theme['on_surface'],
-            size=14,
-            weight=ft.FontWeight.W_500
-        ),
+        content_padding=_padding_symmetric(16, 8),
+        label_style=_text_style(theme['on_surface_variant'], 14),
+        text_style=_text_style(theme['on_surface'], 14, ft.FontWeight.W_500),
         width=width
     )
 
 def create_status_chip(
     text: str,
     status: str = "info",
-    theme: Dict[str, str] = None,
+    theme: Dict[str, str] = _DEFAULT_STATUS_CHIP_THEME,
     icon: Optional[str] = None
 ) -> ft.Container:
     """Create status chip"""
     
-    if theme is None:
-        theme = {
-            'info': '#3b82f6',
-            'success': '#059669',
-            'warning': '#f59e0b',
-            'error': '#dc2626',
-            'on_primary': '#ffffff'
-        }
-    
-    # Get status color
-    status_colors = {
-        'info': theme['info'],
-        'success': theme['success'],
-        'warning': theme['warning'],
-        'error': theme['error']
-    }
-    
-    bg_color = status_colors.get(status, theme['info'])
+    # Status names double as theme color keys
+    bg_color = theme[status if status in _STATUS_KEYS else 'info']
     text_color = theme['on_primary']
     
     content = []
@@ -263,25 +299,18 @@ def create_status_chip(
         ),
         bgcolor=bg_color,
         border_radius=20,
-        padding=ft.padding.symmetric(horizontal=12, vertical=6),
-        animate=ft.Animation(150, ft.AnimationCurve.EASE_OUT)
+        padding=_padding_symmetric(12, 6),
+        animate=_ANIMATION_FAST
     )
 
 def create_progress_indicator(
     message: str = "Procesando...",
     progress: Optional[float] = None,
-    theme: Dict[str, str] = None,
+    theme: Dict[str, str] = _DEFAULT_PROGRESS_THEME,
     show_spinner: bool = True
 ) -> ft.Container:
     """Create progress indicator with spinner and/or progress bar"""
     
-    if theme is None:
-        theme = {
-            'primary': '#2563eb',
-            'on_surface': '#0f172a',
-            'surface': '#ffffff'
-        }
-    
     content = []
     
     if show_spinner:
@@ -329,27 +358,19 @@ def create_progress_indicator(
             spacing=16
         ),
         alignment=ft.alignment.center,
-        padding=ft.padding.all(20)
+        padding=_padding_all(20)
     )
 
 def create_file_info_card(
     filename: str,
     file_path: str,
     file_size: str,
-    theme: Dict[str, str] = None,
+    theme: Dict[str, str] = _DEFAULT_FILE_INFO_THEME,
     status: str = "info",
     additional_info: Optional[str] = None
 ) -> ft.Container:
     """Create file information card"""
     
-    if theme is None:
-        theme = {
-            'surface': '#ffffff',
-            'border': '#e2e8f0',
-            'on_surface': '#0f172a',
-            'on_surface_variant': '#64748b'
-        }
-    
     content = [
         ft.Row([
             ft.Icon(ft.Icons.PICTURE_AS_PDF, color=theme.get('primary', '#2563eb'), size=24),
@@ -386,4 +407,4 @@ def create_file_info_card(
             )
         )
     
-    return create_modern_card(content, theme, ft.padding.all(16))
+    return create_modern_card(content, theme, _padding_all(16))
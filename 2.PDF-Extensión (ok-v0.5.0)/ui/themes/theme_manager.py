@@ -5,19 +5,41 @@ Handles light/dark theme switching with blue color scheme
 
 import flet as ft
 import json
+import weakref
 from pathlib import Path
-from typing import Dict, List, Callable, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Callable, Optional
 from config.settings import THEME_CONFIG
 
+# Read-only views of the theme palettes, shared by every consumer
+LIGHT_THEME = MappingProxyType(THEME_CONFIG["light"])
+DARK_THEME = MappingProxyType(THEME_CONFIG["dark"])
+
+# Flet page themes keyed by their color scheme seed
+_FLET_THEME_CACHE: Dict[str, ft.Theme] = {}
+
+def _listener_key(callback: Callable) -> Any:
+    """Key a listener without holding a strong reference to a method's owner"""
+    owner = getattr(callback, '__self__', None)
+    if owner is not None and hasattr(callback, '__func__'):
+        return (id(owner), callback.__func__)
+    return callback
+
 class ThemeManager:
     """Manages application themes and theme switching"""
     
+    __slots__ = ('config_dir', 'config_file', '_is_dark', '_themes', '_listeners', '_current')
+    
     def __init__(self, config_dir: Path):
         self.config_dir = config_dir
         self.config_file = config_dir / "theme_config.json"
         self._is_dark = False
-        self._listeners: List[Callable] = []
+        # Indexed by the dark-mode flag
+        self._themes = (LIGHT_THEME, DARK_THEME)
+        # Listener key -> callable returning the listener, or None once collected
+        self._listeners: Dict[Any, Callable[[], Optional[Callable]]] = {}
         self._load_theme_preference()
+        self._current = self._themes[self._is_dark]
     
     def _load_theme_preference(self):
         """Load theme preference from configuration file"""
@@ -25,7 +47,7 @@ class ThemeManager:
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     config = json.load(f)
-                    self._is_dark = config.get('is_dark', False)
+                    self._is_dark = bool(config.get('is_dark', False))
             except Exception as e:
                 print(f"Error loading theme preference: {e}")
                 self._is_dark = False
@@ -52,11 +74,12 @@ class ThemeManager:
     
     def get_theme(self) -> Dict[str, str]:
         """Get current theme colors"""
-        return THEME_CONFIG["dark" if self._is_dark else "light"]
+        return self._current
     
     def toggle_theme(self):
         """Toggle between light and dark themes"""
         self._is_dark = not self._is_dark
+        self._current = self._themes[self._is_dark]
         self._save_theme_preference()
         self._notify_listeners()
     
@@ -64,22 +87,46 @@ class ThemeManager:
         """Set specific theme"""
         if self._is_dark != is_dark:
             self._is_dark = is_dark
+            self._current = self._themes[is_dark]
             self._save_theme_preference()
             self._notify_listeners()
     
-    def add_listener(self, callback: Callable[[Dict[str, str]], None]):
-        """Add theme change listener"""
-        self._listeners.append(callback)
+    def add_listener(self, callback: Callable[[Dict[str, str]], None]) -> Callable[[], None]:
+        """Add theme change listener
+        
+        Bound methods are held weakly, so listeners of discarded widgets
+        drop out without an explicit remove_listener call.
+        
+        Args:
+            callback: Called with the new theme on every change
+            
+        Returns:
+            Callable that removes the listener
+        """
+        key = _listener_key(callback)
+        if key is callback:
+            self._listeners[key] = lambda: callback
+        else:
+            self._listeners[key] = weakref.WeakMethod(callback)
+        return lambda: self._listeners.pop(key, None)
     
     def remove_listener(self, callback: Callable[[Dict[str, str]], None]):
         """Remove theme change listener"""
-        if callback in self._listeners:
-            self._listeners.remove(callback)
+        self._listeners.pop(_listener_key(callback), None)
     
     def _notify_listeners(self):
         """Notify all listeners of theme change"""
+        if not self._listeners:
+            return
+        
         theme = self.get_theme()
-        for callback in self._listeners:
+        # Snapshot so listeners may add or remove listeners while notified
+        for key, ref in list(self._listeners.items()):
+            callback = ref()
+            if callback is None:
+                # Owner was garbage collected
+                self._listeners.pop(key, None)
+                continue
             try:
                 callback(theme)
             except Exception as e:
@@ -95,11 +142,14 @@ class ThemeManager:
         # Set background color
         page.bgcolor = theme['background']
         
-        # Configure custom theme with blue color scheme
-        page.theme = ft.Theme(
-            color_scheme_seed=theme['primary'],
-            use_material3=True
-        )
+        # Configure custom theme with blue color scheme, one object per seed
+        flet_theme = _FLET_THEME_CACHE.get(theme['primary'])
+        if flet_theme is None:
+            flet_theme = _FLET_THEME_CACHE[theme['primary']] = ft.Theme(
+                color_scheme_seed=theme['primary'],
+                use_material3=True
+            )
+        page.theme = flet_theme
         
         # Update page
         page.update()
@@ -3,6 +3,7 @@ Helper utilities for HYDRA21 PDF Compressor
 Common utility functions used throughout the application
 """
 
+import asyncio
 import time
 import threading
 from pathlib import Path
@@ -210,6 +211,138 @@ class Debouncer:
                 self._timer.cancel()
                 self._timer = None
 
+class Throttle:
+    """Throttle a function to at most one call per time window"""
+    
+    def __init__(self, func: Callable, interval: float = 0.05, trailing: bool = False):
+        self.func = func
+        self.interval = interval
+        self.trailing = trailing
+        self._last_call = 0.0
+        self._pending = None
+        self._timer = None
+        self._lock = threading.Lock()
+    
+    def __call__(self, *args, **kwargs):
+        """
+        Call the function unless it already ran within the interval
+        
+        Calls made inside the interval are dropped, or with ``trailing`` the
+        latest one is delivered when the interval ends. The function runs
+        under the throttle's lock, so it should only hand work off.
+        
+        Args:
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+        """
+        now = time.monotonic()
+        with self._lock:
+            elapsed = now - self._last_call
+            if elapsed < self.interval:
+                if self.trailing:
+                    self._pending = (args, kwargs)
+                    if self._timer is None:
+                        self._timer = threading.Timer(self.interval - elapsed, self._flush)
+                        self._timer.daemon = True
+                        self._timer.start()
+                return
+            
+            # This call supersedes any pending trailing call
+            self._pending = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._last_call = now
+            self.func(*args, **kwargs)
+    
+    def cancel(self):
+        """
+        Drop the pending trailing call, if any
+        
+        Once this returns no trailing call will be delivered, so the caller
+        can post a final state that stale calls cannot overwrite.
+        """
+        with self._lock:
+            self._pending = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+    
+    def _flush(self):
+        """Deliver the latest call dropped during the interval"""
+        with self._lock:
+            self._timer = None
+            pending, self._pending = self._pending, None
+            if pending is None:
+                return
+            self._last_call = time.monotonic()
+            args, kwargs = pending
+            self.func(*args, **kwargs)
+
+class LatestValue:
+    """
+    Single-slot mailbox that keeps only the most recent value
+    
+    Producers overwrite the slot from any thread; a consumer polling at its
+    own pace sees a burst of updates as one value.
+    """
+    
+    def __init__(self):
+        self._value = None
+        self._dirty = threading.Event()
+    
+    def publish(self, value: Any):
+        """
+        Replace the stored value
+        
+        Args:
+            value: New value, superseding any unread one
+        """
+        self._value = value
+        self._dirty.set()
+    
+    def take(self) -> Optional[Any]:
+        """
+        Get the latest value if it has not been taken yet
+        
+        Returns:
+            The latest unread value, or None
+        """
+        if not self._dirty.is_set():
+            return None
+        self._dirty.clear()
+        return self._value
+
+async def _call_async(func: Callable, *args):
+    func(*args)
+
+def run_on_ui(page, func: Callable, *args):
+    """
+    Run a UI callback on the page's event loop from any thread
+    
+    Args:
+        page: Flet page that owns the controls
+        func: Synchronous function that mutates and updates controls
+        *args: Function arguments
+    """
+    page.run_task(_call_async, func, *args)
+
+async def run_blocking(func: Callable, *args) -> Any:
+    """
+    Run a blocking call on the default executor and await its result
+    
+    Same as asyncio.to_thread, which needs Python 3.9; the extension still
+    supports Python 3.8.
+    
+    Args:
+        func: Blocking function to run
+        *args: Function arguments
+        
+    Returns:
+        The function's return value
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
 class RateLimiter:
     """Rate limiter to control function execution frequency"""
     